@@ -13,6 +13,9 @@ from typing import Literal, Self
 from pydantic import Field, computed_field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Basic shape check for NetSuite login emails
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 class NetSuiteConfig(BaseSettings):
     """NetSuite-specific configuration settings."""
@@ -78,9 +81,7 @@ class NetSuiteConfig(BaseSettings):
     @classmethod
     def validate_email(cls, v: str | None) -> str | None:
         """Validate email format if provided."""
-        if v is not None and v != "" and not re.match(
-            r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", v
-        ):
+        if v is not None and v != "" and not _EMAIL_RE.match(v):
             raise ValueError(f"Invalid email format: {v}")
         return v
 
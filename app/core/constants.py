@@ -25,6 +25,27 @@ NETSUITE_DEFAULT_SOAP_TIMEOUT: Final[int] = 1200  # 20 minutes
 NETSUITE_DEFAULT_RESTLET_TIMEOUT: Final[int] = 300  # 5 minutes
 NETSUITE_DEFAULT_APPLICATION_ID: Final[str] = "A1B2C3D4-E5F6-G7H8-I9J0-K1L2M3N4O5P6"
 
+# RESTlet HTTP connection pool (shared by all RESTlet clients in the process)
+NETSUITE_RESTLET_MAX_CONNECTIONS: Final[int] = 200
+NETSUITE_RESTLET_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 100
+
+# SOAP HTTP connection pool (shared by all SOAP clients in the process)
+NETSUITE_SOAP_POOL_CONNECTIONS: Final[int] = 10
+NETSUITE_SOAP_POOL_MAXSIZE: Final[int] = 100
+
+# SOAP OAuth nonces (random bytes per nonce, and bytes read from the OS per refill)
+NETSUITE_SOAP_NONCE_BYTES: Final[int] = 32
+NETSUITE_SOAP_NONCE_POOL_SIZE: Final[int] = 4096
+
+# RESTlet GET response cache
+NETSUITE_RESTLET_CACHE_MAX_SIZE: Final[int] = 1024
+NETSUITE_RESTLET_CACHE_TTL: Final[float] = 60.0  # seconds
+
+# RESTlet request batching
+NETSUITE_RESTLET_BATCH_MAX_SIZE: Final[int] = 50
+NETSUITE_RESTLET_BATCH_MAX_DELAY_MS: Final[float] = 5.0
+NETSUITE_RESTLET_BATCH_MAX_IN_FLIGHT: Final[int] = 4
+
 # API Routes
 API_PREFIX: Final[str] = "/api"
 HEALTH_PATH: Final[str] = "/health"
@@ -9,13 +9,15 @@ This module configures structlog for the application with:
 
 import logging
 import sys
+from collections.abc import Callable
 from contextvars import ContextVar
 from typing import Any, cast
 
+import orjson
 import structlog
 from structlog.processors import CallsiteParameter
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
 from app.types import RequestContext
 
 # Context variable for storing request context
@@ -38,15 +40,27 @@ def inject_request_context(
     return event_dict
 
 
-def configure_logging() -> None:
-    """Configure structured logging for the application."""
-    settings = get_settings()
+def _orjson_dumps(obj: object, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer."""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def configure_logging(settings: Settings | None = None) -> None:
+    """Configure structured logging for the application.
+
+    Args:
+        settings: Settings to configure from (defaults to the cached application settings)
+    """
+    if settings is None:
+        settings = get_settings()
+
+    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
 
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, settings.log_level.upper(), logging.INFO),
+        level=log_level,
     )
 
     # Determine if we should use JSON or console rendering
@@ -75,7 +89,10 @@ def configure_logging() -> None:
     # Environment-specific processors
     if use_json:
         # Production: JSON output
-        processors = [*shared_processors, structlog.processors.JSONRenderer()]
+        processors = [
+            *shared_processors,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        ]
     else:
         # Development: Human-readable output with colors
         processors = [
@@ -90,6 +107,8 @@ def configure_logging() -> None:
     structlog.configure(
         processors=cast("Any", processors),  # structlog's type hints are incomplete
         context_class=dict,
+        # Calls below the configured level return before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
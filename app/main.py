@@ -25,6 +25,7 @@ from app.core.exceptions import (
     ValidationError,
 )
 from app.core.logging import configure_logging, get_logger
+from app.services.netsuite.restlet import close_http_client
 
 
 @asynccontextmanager
@@ -39,7 +40,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app.state.settings = settings
 
     # Configure logging
-    configure_logging()
+    configure_logging(settings)
     logger = get_logger(__name__)
     logger.info(
         "Application started",
@@ -53,6 +54,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # Shutdown
     logger.info("Application shutting down")
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
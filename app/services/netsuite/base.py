@@ -1,7 +1,9 @@
 """Base classes for NetSuite service implementations."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
+
+import structlog
 
 from app.core.config import NetSuiteConfig
 from app.core.exceptions import (
@@ -15,6 +17,13 @@ from app.core.logging import get_logger
 class BaseNetSuiteClient(ABC):
     """Abstract base class for NetSuite clients."""
 
+    logger: ClassVar[structlog.BoundLogger] = get_logger("BaseNetSuiteClient")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Attach one logger per subclass, shared by all of its instances."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = get_logger(cls.__name__)
+
     def __init__(self, config: NetSuiteConfig) -> None:
         """Initialize base NetSuite client.
 
@@ -22,7 +31,6 @@ class BaseNetSuiteClient(ABC):
             config: NetSuite configuration
         """
         self.config = config
-        self.logger = get_logger(self.__class__.__name__)
 
         # Validate authentication
         if config.auth_type == "none":
@@ -82,6 +90,13 @@ class BaseNetSuiteClient(ABC):
 class BaseNetSuiteService(ABC):
     """Abstract base class for NetSuite business services."""
 
+    logger: ClassVar[structlog.BoundLogger] = get_logger("BaseNetSuiteService")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Attach one logger per subclass, shared by all of its instances."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = get_logger(cls.__name__)
+
     def __init__(self, client: BaseNetSuiteClient) -> None:
         """Initialize base service.
 
@@ -89,7 +104,6 @@ class BaseNetSuiteService(ABC):
             client: NetSuite client instance
         """
         self.client = client
-        self.logger = get_logger(self.__class__.__name__)
 
     @abstractmethod
     async def search(self, criteria: dict[str, Any]) -> list[dict[str, Any]]:
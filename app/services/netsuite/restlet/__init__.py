@@ -1,5 +1,21 @@
 """NetSuite RESTlet services package."""
 
-from app.services.netsuite.restlet.client import NetSuiteRestletClient
+from app.services.netsuite.restlet.auth import NetSuiteOAuth1Auth, NetSuitePasswordAuth
+from app.services.netsuite.restlet.batching import BatchingRestletClient
+from app.services.netsuite.restlet.cache import RestletResponseCache, get_response_cache
+from app.services.netsuite.restlet.client import (
+    NetSuiteRestletClient,
+    close_http_client,
+    get_http_client,
+)
 
-__all__ = ["NetSuiteRestletClient"]
+__all__ = [
+    "BatchingRestletClient",
+    "NetSuiteOAuth1Auth",
+    "NetSuitePasswordAuth",
+    "NetSuiteRestletClient",
+    "RestletResponseCache",
+    "close_http_client",
+    "get_http_client",
+    "get_response_cache",
+]
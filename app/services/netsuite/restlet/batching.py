@@ -0,0 +1,169 @@
+"""Batching wrapper that coalesces concurrent RESTlet calls into single requests."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from app.core.constants import (
+    NETSUITE_RESTLET_BATCH_MAX_DELAY_MS,
+    NETSUITE_RESTLET_BATCH_MAX_IN_FLIGHT,
+    NETSUITE_RESTLET_BATCH_MAX_SIZE,
+)
+from app.core.exceptions import RESTletError
+from app.core.logging import get_logger
+from app.services.netsuite.restlet.client import NetSuiteRestletClient
+
+logger = get_logger(__name__)
+
+
+def _fail_closed(calls: list["_PendingCall"]) -> None:
+    """Fail every unresolved call because the batching client was closed."""
+    for pending in calls:
+        if not pending.future.done():
+            pending.future.set_exception(RuntimeError("Batching client closed"))
+
+
+@dataclass
+class _PendingCall:
+    """A queued RESTlet call waiting to be sent as part of a batch."""
+
+    op: str
+    payload: Any
+    future: asyncio.Future[Any] = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+
+
+class BatchingRestletClient:
+    """Coalesce concurrent RESTlet calls into batched POST requests.
+
+    Calls are queued and drained by a background worker, which collects up to
+    ``max_batch`` calls or waits at most ``max_delay_ms`` before sending them.
+    Each operation in a batch is sent as one POST with the body
+    ``{"op": op, "items": [...]}``; the RESTlet must respond with a JSON array
+    holding one result per item, in the same order.
+    """
+
+    def __init__(
+        self,
+        client: NetSuiteRestletClient,
+        max_batch: int = NETSUITE_RESTLET_BATCH_MAX_SIZE,
+        max_delay_ms: float = NETSUITE_RESTLET_BATCH_MAX_DELAY_MS,
+        max_in_flight: int = NETSUITE_RESTLET_BATCH_MAX_IN_FLIGHT,
+    ) -> None:
+        """Initialize the batching client.
+
+        Args:
+            client: RESTlet client used to send batched requests
+            max_batch: Maximum number of calls sent in one batch
+            max_delay_ms: Maximum time to wait for a batch to fill, in milliseconds
+            max_in_flight: Maximum number of batches sent concurrently
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.client = client
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self._queue: asyncio.Queue[_PendingCall] = asyncio.Queue()
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._worker: asyncio.Task[None] | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def call(self, op: str, payload: Any) -> Any:
+        """Queue a RESTlet call and wait for its result.
+
+        Args:
+            op: RESTlet operation name
+            payload: Item payload for the operation
+
+        Returns:
+            Result for this item from the RESTlet response
+        """
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+        pending = _PendingCall(op=op, payload=payload)
+        self._queue.put_nowait(pending)
+        return await pending.future
+
+    async def close(self) -> None:
+        """Stop the worker, wait for in-flight batches and fail queued calls."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+        await asyncio.gather(*self._batches, return_exceptions=True)
+
+        queued: list[_PendingCall] = []
+        while not self._queue.empty():
+            queued.append(self._queue.get_nowait())
+        _fail_closed(queued)
+
+    async def _run(self) -> None:
+        """Drain the queue into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self.max_delay
+                while len(batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except TimeoutError:
+                        break
+
+                await self._in_flight.acquire()
+            except asyncio.CancelledError:
+                # Calls already taken off the queue are not failed by close()
+                _fail_closed(batch)
+                raise
+            task = asyncio.create_task(self._dispatch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _dispatch(self, batch: list[_PendingCall]) -> None:
+        """Send a batch, one POST per operation, and resolve each call's future."""
+        try:
+            calls_by_op: dict[str, list[_PendingCall]] = {}
+            for pending in batch:
+                calls_by_op.setdefault(pending.op, []).append(pending)
+
+            for op, calls in calls_by_op.items():
+                await self._send(op, calls)
+        finally:
+            self._in_flight.release()
+
+    async def _send(self, op: str, calls: list[_PendingCall]) -> None:
+        """Send one operation's calls as a single RESTlet POST."""
+        logger.debug("Sending batched RESTlet request", op=op, batch_size=len(calls))
+        try:
+            results = await self.client.post(
+                data={"op": op, "items": [pending.payload for pending in calls]}
+            )
+            if not isinstance(results, list) or len(cast("list[Any]", results)) != len(calls):
+                raise RESTletError(
+                    self.client.config.script_id or "unknown",
+                    error_code="INVALID_BATCH_RESPONSE",
+                    error_details={
+                        "message": "Batch response must be a list with one result per item",
+                        "op": op,
+                        "batch_size": len(calls),
+                    },
+                )
+        except Exception as e:
+            logger.error("Batched RESTlet request failed", op=op, error=str(e))
+            for pending in calls:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        for pending, result in zip(calls, cast("list[Any]", results), strict=True):
+            if not pending.future.done():
+                pending.future.set_result(result)
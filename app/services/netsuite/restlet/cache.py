@@ -0,0 +1,105 @@
+"""In-memory TTL cache for idempotent RESTlet GET responses."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from functools import lru_cache
+
+import httpx
+
+from app.core.constants import NETSUITE_RESTLET_CACHE_MAX_SIZE, NETSUITE_RESTLET_CACHE_TTL
+
+
+class RestletResponseCache:
+    """Bounded, least-recently-used cache of RESTlet responses with per-entry TTLs.
+
+    Responses are stored rather than parsed data so every hit is decoded
+    afresh and callers never share (and mutate) the same objects. Each entry
+    may belong to a scope so that a write can drop every response it may
+    have made stale. The cache is only touched from the event loop without
+    awaiting, so it needs no lock.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = NETSUITE_RESTLET_CACHE_MAX_SIZE,
+        default_ttl: float = NETSUITE_RESTLET_CACHE_TTL,
+    ) -> None:
+        """Initialize the response cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            default_ttl: Time-to-live in seconds used when none is given
+        """
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[Hashable, tuple[float, httpx.Response, Hashable]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of cached responses, including expired ones."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> httpx.Response | None:
+        """Get a cached response if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response, _scope = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def set(
+        self,
+        key: Hashable,
+        response: httpx.Response,
+        ttl: float | None = None,
+        scope: Hashable = None,
+    ) -> None:
+        """Cache a response.
+
+        Args:
+            key: Cache key
+            response: Response to cache
+            ttl: Time-to-live in seconds (defaults to ``default_ttl``)
+            scope: Group the entry belongs to, for ``invalidate``
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, response, scope)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, scope: Hashable) -> None:
+        """Remove every cached response in a scope.
+
+        Args:
+            scope: Scope given when the responses were cached
+        """
+        stale = [key for key, (_, _, entry_scope) in self._entries.items() if entry_scope == scope]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self._entries.clear()
+
+
+@lru_cache
+def get_response_cache() -> RestletResponseCache:
+    """Get the RESTlet response cache shared by every RESTlet client."""
+    return RestletResponseCache()
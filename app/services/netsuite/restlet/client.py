@@ -1,12 +1,22 @@
 """NetSuite RESTlet client implementation with OAuth1 support."""
 
+import hashlib
+import hmac
+import secrets
+from decimal import Decimal
+from functools import lru_cache
 from typing import Any, cast
+from urllib.parse import urlencode
 
-import requests
-from requests_oauthlib import OAuth1Session
+import httpx
+import orjson
 
 from app.core.config import NetSuiteConfig
-from app.core.constants import NETSUITE_DEFAULT_RESTLET_TIMEOUT
+from app.core.constants import (
+    NETSUITE_DEFAULT_RESTLET_TIMEOUT,
+    NETSUITE_RESTLET_MAX_CONNECTIONS,
+    NETSUITE_RESTLET_MAX_KEEPALIVE_CONNECTIONS,
+)
 from app.core.exceptions import (
     AuthenticationError,
     NetSuiteError,
@@ -14,121 +24,197 @@ from app.core.exceptions import (
     RESTletError,
 )
 from app.core.logging import get_logger
+from app.services.netsuite.restlet.auth import NetSuiteOAuth1Auth, NetSuitePasswordAuth
+from app.services.netsuite.restlet.cache import RestletResponseCache, get_response_cache
 
 logger = get_logger(__name__)
 
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "User-Agent": "NetSuite-Proxy/1.0",
+}
+
+# Bodies are pre-encoded, so the content type is set explicitly per request
+JSON_BODY_HEADERS = {"Content-Type": "application/json"}
+
+# Per-process key for hashing credentials into response cache keys
+_CACHE_IDENTITY_KEY = secrets.token_bytes(32)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        # Keep full precision; NetSuite accepts numeric strings
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _credential_digest(config: NetSuiteConfig) -> bytes:
+    """Hash the full credential set identifying who a response was fetched for.
+
+    Secrets are part of the digest so a request with a known email or token ID
+    but the wrong password or secret can never be served a cached response.
+    """
+    credentials = (
+        config.account,
+        config.auth_type,
+        config.email,
+        config.password,
+        config.role,
+        config.consumer_key,
+        config.consumer_secret,
+        config.token_id,
+        config.token_secret,
+    )
+    return hmac.digest(_CACHE_IDENTITY_KEY, orjson.dumps(credentials), hashlib.sha256)
+
+
+def _encode_body(data: dict[str, Any] | None) -> bytes | None:
+    """Encode a request body as JSON bytes."""
+    if data is None:
+        return None
+    return orjson.dumps(data, default=_json_default)
+
+
+@lru_cache
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for RESTlet requests.
+
+    A single HTTP/2 client is shared by every RESTlet client in the process so
+    concurrent requests are multiplexed over a small pool of connections.
+    Authentication is applied per request, so the client holds no credentials.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        headers=DEFAULT_HEADERS,
+        limits=httpx.Limits(
+            max_connections=NETSUITE_RESTLET_MAX_CONNECTIONS,
+            max_keepalive_connections=NETSUITE_RESTLET_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client if it has been created."""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
+
 
 class NetSuiteRestletClient:
     """Client for interacting with NetSuite RESTlet scripts."""
 
-    def __init__(self, config: NetSuiteConfig) -> None:
+    def __init__(
+        self,
+        config: NetSuiteConfig,
+        http_client: httpx.AsyncClient | None = None,
+        response_cache: RestletResponseCache | None = None,
+    ) -> None:
         """Initialize NetSuite RESTlet client.
 
         Args:
             config: NetSuite configuration containing auth credentials
+            http_client: HTTP client to use (defaults to the shared client)
+            response_cache: Cache for GET responses (defaults to the shared cache)
         """
         self.config = config
-        self._session: OAuth1Session | requests.Session | None = None
+        self._http_client = http_client
+        self.response_cache = response_cache if response_cache is not None else get_response_cache()
+        self._auth: httpx.Auth | None = None
         self.default_timeout = NETSUITE_DEFAULT_RESTLET_TIMEOUT
 
         # Validate RESTlet configuration
         if not config.script_id or not config.deploy_id:
             raise ValueError("RESTlet script_id and deploy_id are required")
 
-        logger.info(
-            "Initializing NetSuite RESTlet client",
+        # NetSuite RESTlet URL format
+        # https://{accountId}.restlets.api.netsuite.com/app/site/hosting/restlet.nl
+        # Sandbox accounts (e.g. TEST_SB1) use the same format with "_" -> "-"
+        account_id = config.account.lower().replace("_", "-")
+        self._base_url = (
+            f"https://{account_id}.restlets.api.netsuite.com/app/site/hosting/restlet.nl"
+        )
+        # URL for the common case of a request with no extra query parameters
+        required_params = urlencode({"script": config.script_id, "deploy": config.deploy_id})
+        self._url_prefix = f"{self._base_url}?{required_params}"
+
+        # Cached responses are only shared between clients with identical
+        # credentials, and writes to the deployment drop its cached reads
+        self._cache_identity = _credential_digest(config)
+        self._cache_scope = (config.account, config.script_id, config.deploy_id)
+
+        # Static context is bound once so each log call only carries its own fields
+        self.logger = logger.bind(
             account=config.account,
             script_id=config.script_id,
             deploy_id=config.deploy_id,
-            auth_type=config.auth_type,
         )
+        self.logger.info("Initializing NetSuite RESTlet client", auth_type=config.auth_type)
 
     @property
     def base_url(self) -> str:
         """Get NetSuite RESTlet base URL."""
-        # NetSuite RESTlet URL format
-        # https://{accountId}.restlets.api.netsuite.com/app/site/hosting/restlet.nl
-        account_id = self.config.account.lower().replace("_", "-")
-
-        # For sandbox accounts, use different subdomain
-        # In this case, both branches are the same, so we can simplify
-        subdomain = account_id
+        return self._base_url
 
-        return f"https://{subdomain}.restlets.api.netsuite.com/app/site/hosting/restlet.nl"
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client used for RESTlet requests."""
+        if self._http_client is None:
+            self._http_client = get_http_client()
+        return self._http_client
 
     @property
-    def session(self) -> OAuth1Session | requests.Session:
-        """Get or create HTTP session with authentication."""
-        if self._session is None:
+    def auth(self) -> httpx.Auth:
+        """Get or create the request authentication flow."""
+        if self._auth is None:
             if self.config.auth_type == "oauth":
-                self._session = self._create_oauth_session()
+                self._auth = self._create_oauth_auth()
             elif self.config.auth_type == "password":
-                self._session = self._create_password_session()
+                self._auth = self._create_password_auth()
             else:
                 raise AuthenticationError(f"Unsupported auth type: {self.config.auth_type}")
-        return self._session
-
-    def _create_oauth_session(self) -> OAuth1Session:
-        """Create OAuth1 session for RESTlet authentication."""
-        if not all(
-            [
-                self.config.consumer_key,
-                self.config.consumer_secret,
-                self.config.token_id,
-                self.config.token_secret,
-            ]
-        ):
+        return self._auth
+
+    def _create_oauth_auth(self) -> NetSuiteOAuth1Auth:
+        """Create OAuth1 auth flow for RESTlet authentication."""
+        consumer_key = self.config.consumer_key
+        consumer_secret = self.config.consumer_secret
+        token_id = self.config.token_id
+        token_secret = self.config.token_secret
+        if not consumer_key or not consumer_secret or not token_id or not token_secret:
             raise AuthenticationError(
                 "OAuth credentials required: consumer_key, consumer_secret, token_id, token_secret"
             )
 
-        # Create OAuth1 session with HMAC-SHA256
-        session = OAuth1Session(
-            client_key=self.config.consumer_key,
-            client_secret=self.config.consumer_secret,
-            resource_owner_key=self.config.token_id,
-            resource_owner_secret=self.config.token_secret,
-            signature_method="HMAC-SHA256",
-        )
-        # Set realm in auth object after creation
-        session.auth.realm = self.config.account  # type: ignore[attr-defined]
-
-        # Set common headers
-        session.headers.update(
-            {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "User-Agent": "NetSuite-Proxy/1.0",
-            }
+        # OAuth1 with HMAC-SHA256, using the account as realm
+        auth = NetSuiteOAuth1Auth(
+            consumer_key=consumer_key,
+            consumer_secret=consumer_secret,
+            token_id=token_id,
+            token_secret=token_secret,
+            realm=self.config.account,
         )
 
-        logger.debug("Created OAuth session for RESTlet")
-        return session
+        self.logger.debug("Created OAuth auth for RESTlet")
+        return auth
 
-    def _create_password_session(self) -> requests.Session:
-        """Create session with password authentication headers."""
+    def _create_password_auth(self) -> NetSuitePasswordAuth:
+        """Create auth flow with password authentication headers."""
         if not self.config.email or not self.config.password:
             raise AuthenticationError("Email and password required for password auth")
 
-        session = requests.Session()
-
         # NetSuite RESTlet password auth uses custom headers
-        auth_headers = {
-            "NS-Email": self.config.email,
-            "NS-Password": self.config.password,
-            "NS-Account": self.config.account,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "NetSuite-Proxy/1.0",
-        }
-
-        if self.config.role:
-            auth_headers["NS-Role"] = self.config.role
-
-        session.headers.update(auth_headers)
+        auth = NetSuitePasswordAuth(
+            account=self.config.account,
+            email=self.config.email,
+            password=self.config.password,
+            role=self.config.role,
+        )
 
-        logger.debug("Created password session for RESTlet")
-        return session
+        self.logger.debug("Created password auth for RESTlet")
+        return auth
 
     def _build_url(self, **params: Any) -> str:
         """Build full RESTlet URL with required parameters.
@@ -139,56 +225,67 @@ class NetSuiteRestletClient:
         Returns:
             Full URL with query parameters
         """
-        # Required parameters for RESTlet
+        if not params:
+            return self._url_prefix
+
+        # Required parameters for RESTlet, which extra parameters may override
         query_params = {
             "script": self.config.script_id,
             "deploy": self.config.deploy_id,
+            **params,
         }
+        return f"{self._base_url}?{urlencode(query_params)}"
 
-        # Add any additional parameters
-        query_params.update(params)
-
-        # Build query string
-        query_string = "&".join(f"{k}={v}" for k, v in query_params.items())
-
-        return f"{self.base_url}?{query_string}"
-
-    def get(
+    async def get(
         self,
         params: dict[str, Any] | None = None,
         timeout: int | None = None,
+        cache_ttl: float | None = None,
     ) -> Any:
         """Execute GET request to RESTlet.
 
+        Successful responses are cached by URL and credentials, so repeated
+        reads within the TTL skip the network. Writes through any client for
+        the same deployment invalidate them.
+
         Args:
             params: Query parameters to send
             timeout: Request timeout in seconds
+            cache_ttl: Seconds to cache the response (defaults to the cache's
+                TTL; 0 bypasses the cache)
 
         Returns:
             Response data from RESTlet
         """
         url = self._build_url(**(params or {}))
         timeout = timeout or self.default_timeout
+        cache_key = (self._cache_identity, url)
+
+        if cache_ttl != 0:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("Serving RESTlet GET from cache")
+                return self._handle_response(cached)
 
         try:
-            logger.info(
+            self.logger.info(
                 "Executing RESTlet GET request",
-                script_id=self.config.script_id,
-                deploy_id=self.config.deploy_id,
                 params=params,
             )
 
-            response = self.session.get(url, timeout=timeout)
-            return self._handle_response(response)
+            response = await self.http_client.get(url, auth=self.auth, timeout=timeout)
+            data = self._handle_response(response)
+            self.response_cache.set(cache_key, response, cache_ttl, scope=self._cache_scope)
+            return data
 
-        except requests.exceptions.Timeout as e:
-            logger.error("RESTlet request timed out", timeout=timeout)
+        except httpx.TimeoutException as e:
+            self.logger.error("RESTlet request timed out", timeout=timeout)
             raise NetSuiteTimeoutError("RESTlet GET", timeout) from e
         except Exception as e:
-            logger.error("RESTlet GET failed", error=str(e))
+            self.logger.error("RESTlet GET failed", error=str(e))
             self._handle_request_error(e)
 
-    def post(
+    async def post(
         self,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
@@ -208,24 +305,31 @@ class NetSuiteRestletClient:
         timeout = timeout or self.default_timeout
 
         try:
-            logger.info(
+            self.logger.info(
                 "Executing RESTlet POST request",
-                script_id=self.config.script_id,
-                deploy_id=self.config.deploy_id,
                 has_data=data is not None,
             )
 
-            response = self.session.post(url, json=data, timeout=timeout)
+            response = await self.http_client.post(
+                url,
+                content=_encode_body(data),
+                headers=JSON_BODY_HEADERS,
+                auth=self.auth,
+                timeout=timeout,
+            )
             return self._handle_response(response)
 
-        except requests.exceptions.Timeout as e:
-            logger.error("RESTlet request timed out", timeout=timeout)
+        except httpx.TimeoutException as e:
+            self.logger.error("RESTlet request timed out", timeout=timeout)
             raise NetSuiteTimeoutError("RESTlet POST", timeout) from e
         except Exception as e:
-            logger.error("RESTlet POST failed", error=str(e))
+            self.logger.error("RESTlet POST failed", error=str(e))
             self._handle_request_error(e)
+        finally:
+            # The write may have landed even if it failed, so drop cached reads either way
+            self.response_cache.invalidate(self._cache_scope)
 
-    def put(
+    async def put(
         self,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
@@ -245,24 +349,31 @@ class NetSuiteRestletClient:
         timeout = timeout or self.default_timeout
 
         try:
-            logger.info(
+            self.logger.info(
                 "Executing RESTlet PUT request",
-                script_id=self.config.script_id,
-                deploy_id=self.config.deploy_id,
                 has_data=data is not None,
             )
 
-            response = self.session.put(url, json=data, timeout=timeout)
+            response = await self.http_client.put(
+                url,
+                content=_encode_body(data),
+                headers=JSON_BODY_HEADERS,
+                auth=self.auth,
+                timeout=timeout,
+            )
             return self._handle_response(response)
 
-        except requests.exceptions.Timeout as e:
-            logger.error("RESTlet request timed out", timeout=timeout)
+        except httpx.TimeoutException as e:
+            self.logger.error("RESTlet request timed out", timeout=timeout)
             raise NetSuiteTimeoutError("RESTlet PUT", timeout) from e
         except Exception as e:
-            logger.error("RESTlet PUT failed", error=str(e))
+            self.logger.error("RESTlet PUT failed", error=str(e))
             self._handle_request_error(e)
+        finally:
+            # The write may have landed even if it failed, so drop cached reads either way
+            self.response_cache.invalidate(self._cache_scope)
 
-    def delete(
+    async def delete(
         self,
         params: dict[str, Any] | None = None,
         timeout: int | None = None,
@@ -280,24 +391,25 @@ class NetSuiteRestletClient:
         timeout = timeout or self.default_timeout
 
         try:
-            logger.info(
+            self.logger.info(
                 "Executing RESTlet DELETE request",
-                script_id=self.config.script_id,
-                deploy_id=self.config.deploy_id,
                 params=params,
             )
 
-            response = self.session.delete(url, timeout=timeout)
+            response = await self.http_client.delete(url, auth=self.auth, timeout=timeout)
             return self._handle_response(response)
 
-        except requests.exceptions.Timeout as e:
-            logger.error("RESTlet request timed out", timeout=timeout)
+        except httpx.TimeoutException as e:
+            self.logger.error("RESTlet request timed out", timeout=timeout)
             raise NetSuiteTimeoutError("RESTlet DELETE", timeout) from e
         except Exception as e:
-            logger.error("RESTlet DELETE failed", error=str(e))
+            self.logger.error("RESTlet DELETE failed", error=str(e))
             self._handle_request_error(e)
+        finally:
+            # The write may have landed even if it failed, so drop cached reads either way
+            self.response_cache.invalidate(self._cache_scope)
 
-    def _handle_response(self, response: requests.Response) -> Any:
+    def _handle_response(self, response: httpx.Response) -> Any:
         """Handle RESTlet response and raise appropriate exceptions.
 
         Args:
@@ -306,10 +418,10 @@ class NetSuiteRestletClient:
         Returns:
             Parsed JSON response data
         """
-        logger.debug(
+        self.logger.debug(
             "RESTlet response received",
             status_code=response.status_code,
-            content_length=len(response.content),
+            content_length=response.headers.get("Content-Length"),
         )
 
         # Check for HTTP errors
@@ -319,7 +431,7 @@ class NetSuiteRestletClient:
             raise AuthenticationError("Insufficient permissions for RESTlet")
         if response.status_code >= 400:
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 error_msg = error_data.get("error", {}).get("message", response.text)
             except Exception:
                 error_msg = response.text
@@ -330,9 +442,9 @@ class NetSuiteRestletClient:
                 error_details={"message": error_msg, "response_text": response.text},
             )
 
-        # Parse JSON response
+        # Parse JSON response (orjson.JSONDecodeError is a ValueError)
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Check for NetSuite error in response
             if isinstance(data, dict):
@@ -356,7 +468,7 @@ class NetSuiteRestletClient:
             return cast("Any", data)
 
         except ValueError as e:
-            logger.error("Failed to parse RESTlet response", error=str(e))
+            self.logger.error("Failed to parse RESTlet response", error=str(e))
             raise RESTletError(
                 self.config.script_id or "unknown",
                 error_code="INVALID_JSON",
@@ -369,8 +481,8 @@ class NetSuiteRestletClient:
         Args:
             error: Original exception
         """
-        if isinstance(error, requests.exceptions.ConnectionError):
+        if isinstance(error, httpx.ConnectError):
             raise NetSuiteError(f"Failed to connect to NetSuite: {error!s}")
-        if isinstance(error, requests.exceptions.RequestException):
+        if isinstance(error, httpx.HTTPError):
             raise NetSuiteError(f"RESTlet request failed: {error!s}")
         raise error
@@ -1,19 +1,22 @@
 """NetSuite SOAP client implementation using zeep."""
 
 import base64
-import hashlib
 import hmac
-import secrets
+import os
+import ssl
+import threading
 import time
-from typing import Any
-
-from zeep import Client, Settings
-from zeep.transports import Transport
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, cast
 
 from app.core.config import NetSuiteConfig
 from app.core.constants import (
     NETSUITE_DEFAULT_APPLICATION_ID,
     NETSUITE_DEFAULT_SOAP_TIMEOUT,
+    NETSUITE_SOAP_NONCE_BYTES,
+    NETSUITE_SOAP_NONCE_POOL_SIZE,
+    NETSUITE_SOAP_POOL_CONNECTIONS,
+    NETSUITE_SOAP_POOL_MAXSIZE,
 )
 from app.core.exceptions import (
     AuthenticationError,
@@ -23,8 +26,157 @@ from app.core.exceptions import (
 )
 from app.core.logging import get_logger
 
+if TYPE_CHECKING:
+    import requests
+    from zeep import Client, Settings
+
 logger = get_logger(__name__)
 
+# NetSuite fault codes that mean the credentials or session were rejected
+AUTH_FAULT_CODES: frozenset[str] = frozenset(
+    {"INVALID_LOGIN_ATTEMPT", "INVALID_LOGIN_CREDENTIALS", "SESSION_TIMED_OUT"}
+)
+
+
+class _NoncePool:
+    """Hand out URL-safe nonces from a buffer of OS random bytes.
+
+    Reading the OS CSPRNG in large blocks avoids one syscall per nonce. The
+    buffer is discarded in forked children so workers never reuse the
+    parent's bytes.
+    """
+
+    def __init__(self, nonce_bytes: int, pool_size: int) -> None:
+        self._nonce_bytes = nonce_bytes
+        self._pool_size = pool_size
+        self._buffer = b""
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> str:
+        """Return the next nonce, refilling the buffer when exhausted."""
+        with self._lock:
+            end = self._offset + self._nonce_bytes
+            if end > len(self._buffer):
+                self._buffer = os.urandom(self._pool_size)
+                self._offset, end = 0, self._nonce_bytes
+            chunk = self._buffer[self._offset : end]
+            self._offset = end
+        return base64.urlsafe_b64encode(chunk).rstrip(b"=").decode()
+
+    def reset(self) -> None:
+        """Discard any buffered random bytes and replace the lock.
+
+        After a fork the child inherits the lock in whatever state the parent
+        left it, so a fresh lock keeps the child from deadlocking on its
+        first nonce.
+        """
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._offset = 0
+
+
+_nonce_pool = _NoncePool(NETSUITE_SOAP_NONCE_BYTES, NETSUITE_SOAP_NONCE_POOL_SIZE)
+os.register_at_fork(after_in_child=_nonce_pool.reset)
+
+# zeep and requests pull in lxml and the XML schema machinery, so they are
+# imported on first use to keep them off the startup path of RESTlet-only workers
+
+
+@lru_cache
+def get_zeep_settings() -> "Settings":
+    """Get the zeep settings used for NetSuite."""
+    from zeep import Settings  # noqa: PLC0415
+
+    return Settings(
+        xml_huge_tree=True,  # type: ignore[call-arg]  # Handle large XML responses
+        strict=False,  # type: ignore[call-arg]  # NetSuite's WSDL sometimes has issues
+        raw_response=False,  # type: ignore[call-arg]
+    )
+
+
+@lru_cache
+def get_ssl_context() -> ssl.SSLContext:
+    """
+    Get the TLS context shared by all SOAP connections.
+
+    Without an explicit context urllib3 builds a new one, and reloads the CA
+    store, for every connection it opens.
+    """
+    return ssl.create_default_context()
+
+
+@lru_cache
+def get_soap_session() -> "requests.Session":
+    """
+    Get the HTTP session shared by all SOAP transports.
+
+    Sharing one session lets every SOAP client reuse the keep-alive
+    connection pool and TLS context instead of opening its own.
+    """
+    import requests  # noqa: PLC0415
+    from requests.adapters import HTTPAdapter  # noqa: PLC0415
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=NETSUITE_SOAP_POOL_CONNECTIONS,
+        pool_maxsize=NETSUITE_SOAP_POOL_MAXSIZE,
+    )
+    adapter.init_poolmanager(
+        NETSUITE_SOAP_POOL_CONNECTIONS,
+        NETSUITE_SOAP_POOL_MAXSIZE,
+        ssl_context=get_ssl_context(),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _platform_fault_code(detail: Any) -> str | None:
+    """Get the NetSuite platform fault code from a SOAP fault's detail element.
+
+    Args:
+        detail: Fault detail element, if the fault has one
+
+    Returns:
+        The code, e.g. ``INVALID_LOGIN_CREDENTIALS``, or None if there is none
+    """
+    if detail is None:
+        return None
+    # e.g. <platformFaults:invalidCredentialsFault><platformFaults:code>...
+    code = cast("str | None", detail.findtext(".//{*}code"))
+    return code.strip() if code else None
+
+
+@lru_cache(maxsize=8)
+def get_zeep_client(wsdl_url: str, timeout: int) -> "Client":
+    """
+    Get a zeep client for a WSDL, shared across SOAP client instances.
+
+    Parsing the NetSuite WSDL is expensive, so the parsed client is cached per
+    WSDL URL and timeout. Shared clients must never hold account-specific
+    state: authentication headers are passed with each operation call.
+
+    Args:
+        wsdl_url: NetSuite WSDL URL
+        timeout: Transport and operation timeout in seconds
+
+    Returns:
+        Shared zeep client
+    """
+    from zeep import Client  # noqa: PLC0415
+    from zeep.cache import InMemoryCache  # noqa: PLC0415
+    from zeep.transports import Transport  # noqa: PLC0415
+
+    logger.debug("Creating zeep client", wsdl_url=wsdl_url)
+    transport = Transport(
+        cache=InMemoryCache(),
+        timeout=timeout,
+        operation_timeout=timeout,
+        session=get_soap_session(),
+    )
+    return Client(wsdl=wsdl_url, settings=get_zeep_settings(), transport=transport)
+
 
 class NetSuiteSoapClient:
     """Client for interacting with NetSuite's SOAP API (SuiteTalk)."""
@@ -39,19 +191,16 @@ class NetSuiteSoapClient:
         self._client: Client | None = None
         self._service: Any = None
 
-        # Configure zeep settings for NetSuite
-        self.settings = Settings(
-            xml_huge_tree=True,  # type: ignore[call-arg]  # Handle large XML responses
-            strict=False,  # type: ignore[call-arg]  # NetSuite's WSDL sometimes has issues
-            raw_response=False,  # type: ignore[call-arg]
-        )
-
-        # Configure transport with timeout from config or default
+        # Transport timeout from config or default
         self.timeout = config.timeout or NETSUITE_DEFAULT_SOAP_TIMEOUT
-        self.transport = Transport(
-            timeout=self.timeout,
-            operation_timeout=self.timeout,
-        )
+
+        # NetSuite WSDL URL format
+        # https://webservices.netsuite.com/wsdl/v{version}/netsuite.wsdl
+        api_version = config.api.replace("_", ".")  # 2024_2 -> 2024.2
+        self.wsdl_url = f"https://webservices.netsuite.com/wsdl/v{api_version}/netsuite.wsdl"
+
+        # OAuth signing key never changes, so it is encoded once
+        self._signing_key_bytes = f"{config.consumer_secret}&{config.token_secret}".encode()
 
         logger.info(
             "Initializing NetSuite SOAP client",
@@ -61,24 +210,16 @@ class NetSuiteSoapClient:
         )
 
     @property
-    def wsdl_url(self) -> str:
-        """Get NetSuite WSDL URL based on account and API version."""
-        # NetSuite WSDL URL format
-        # https://webservices.netsuite.com/wsdl/v{version}/netsuite.wsdl
-        api_version = self.config.api.replace("_", ".")  # 2024_2 -> 2024.2
-        return f"https://webservices.netsuite.com/wsdl/v{api_version}/netsuite.wsdl"
+    def settings(self) -> "Settings":
+        """Get the zeep settings used for NetSuite."""
+        return get_zeep_settings()
 
     @property
-    def client(self) -> Client:
-        """Get or create zeep client instance."""
+    def client(self) -> "Client":
+        """Get the shared zeep client instance."""
         if self._client is None:
-            logger.debug("Creating zeep client", wsdl_url=self.wsdl_url)
             try:
-                self._client = Client(
-                    wsdl=self.wsdl_url,
-                    settings=self.settings,
-                    transport=self.transport,
-                )
+                self._client = get_zeep_client(self.wsdl_url, self.timeout)
             except Exception as e:
                 logger.error("Failed to create SOAP client", error=str(e))
                 raise NetSuiteError(f"Failed to initialize SOAP client: {e!s}") from e
@@ -86,54 +227,51 @@ class NetSuiteSoapClient:
 
     @property
     def service(self) -> Any:
-        """Get SOAP service with authentication headers."""
+        """Get SOAP service proxy."""
         if self._service is None:
             self._service = self.client.service
-            # Set authentication headers
-            self._set_auth_headers()
         return self._service
 
-    def _set_auth_headers(self) -> None:
-        """Set authentication headers based on config."""
-        # NetSuite uses Passport authentication in SOAP header
-        passport = self._create_passport()
+    def _soap_headers(self, **extra_headers: Any) -> dict[str, Any]:
+        """Build the SOAP headers for a single operation call.
 
-        # Create application info
-        application_info = {
-            "applicationId": self.config.application_id or NETSUITE_DEFAULT_APPLICATION_ID,
-        }
-
-        # Set SOAP headers
-        self.client.set_default_soapheaders(  # type: ignore[arg-type]
-            {
-                "passport": passport,
-                "applicationInfo": application_info,
-            }
-        )
+        Headers are sent per call rather than set as defaults because the
+        underlying zeep client is shared between accounts.
 
-        logger.debug("Set SOAP authentication headers")
+        Args:
+            **extra_headers: Additional SOAP headers for this call
 
-    def _create_passport(self) -> dict[str, Any]:
-        """Create passport object for authentication."""
-        passport: dict[str, Any] = {
-            "account": self.config.account,
+        Returns:
+            SOAP headers including authentication
+        """
+        # NetSuite uses Passport authentication in SOAP header
+        return {
+            "passport": self._create_passport(),
+            "applicationInfo": {
+                "applicationId": self.config.application_id or NETSUITE_DEFAULT_APPLICATION_ID,
+            },
+            **extra_headers,
         }
 
+    @cached_property
+    def _passport_template(self) -> dict[str, Any]:
+        """Static passport fields, validated and built once per client."""
         if self.config.auth_type == "password":
             if not self.config.email or not self.config.password:
                 raise AuthenticationError("Email and password required for password auth")
 
-            passport.update(
-                {
-                    "email": self.config.email,
-                    "password": self.config.password,
-                }
-            )
+            passport: dict[str, Any] = {
+                "account": self.config.account,
+                "email": self.config.email,
+                "password": self.config.password,
+            }
 
             if self.config.role:
                 passport["role"] = {"internalId": self.config.role}
 
-        elif self.config.auth_type == "oauth":
+            return passport
+
+        if self.config.auth_type == "oauth":
             if not all(
                 [
                     self.config.consumer_key,
@@ -148,53 +286,62 @@ class NetSuiteSoapClient:
                 )
 
             # For OAuth, we need to use token passport
-            passport = {
+            return {
                 "account": self.config.account,
                 "consumerKey": self.config.consumer_key,
                 "token": self.config.token_id,
-                "nonce": self._generate_nonce(),
-                "timestamp": self._get_timestamp(),
-                "signature": {
-                    "algorithm": "HMAC-SHA256",
-                    "value": self._generate_signature(),
-                },
             }
-        else:
-            raise AuthenticationError(f"Unsupported auth type: {self.config.auth_type}")
 
+        raise AuthenticationError(f"Unsupported auth type: {self.config.auth_type}")
+
+    def _create_passport(self) -> dict[str, Any]:
+        """Create passport object for authentication."""
+        if self.config.auth_type != "oauth":
+            # Password passports never change, so the cached one is sent as-is
+            return self._passport_template
+
+        # The signature must cover the same nonce and timestamp that are sent
+        passport = self._passport_template.copy()
+        nonce = self._generate_nonce()
+        timestamp = self._get_timestamp()
+        passport["nonce"] = nonce
+        passport["timestamp"] = timestamp
+        passport["signature"] = {
+            "algorithm": "HMAC-SHA256",
+            "value": self._generate_signature(nonce, timestamp),
+        }
         return passport
 
     def _generate_nonce(self) -> str:
         """Generate nonce for OAuth."""
-        return secrets.token_urlsafe(32)
+        return _nonce_pool.take()
 
     def _get_timestamp(self) -> str:
         """Get current timestamp for OAuth."""
         return str(int(time.time()))
 
-    def _generate_signature(self) -> str:
-        """Generate OAuth signature."""
+    def _generate_signature(self, nonce: str, timestamp: str) -> str:
+        """Generate OAuth signature.
+
+        Args:
+            nonce: Nonce sent in the passport
+            timestamp: Timestamp sent in the passport
+
+        Returns:
+            Base64-encoded HMAC-SHA256 signature
+        """
         # This is a simplified version - actual implementation needs proper OAuth signing
 
         # Create base string
-        nonce = self._generate_nonce()
-        timestamp = self._get_timestamp()
         base_string = (
             f"{self.config.account}&{self.config.consumer_key}&"
             f"{self.config.token_id}&{nonce}&{timestamp}"
         )
 
-        # Create signing key
-        signing_key = f"{self.config.consumer_secret}&{self.config.token_secret}"
-
         # Generate signature
-        signature = hmac.new(
-            signing_key.encode(),
-            base_string.encode(),
-            hashlib.sha256,
-        ).digest()
+        digest = hmac.digest(self._signing_key_bytes, base_string.encode(), "sha256")
 
-        return base64.b64encode(signature).decode()
+        return base64.b64encode(digest).decode()
 
     def search(
         self,
@@ -223,10 +370,11 @@ class NetSuiteSoapClient:
                 "returnSearchColumns": True,
             }
 
-            self.client.set_options(searchPreferences=search_prefs)  # type: ignore[attr-defined]
-
             # Execute search
-            response = self.service.search(searchRecord=search_record)
+            response = self.service.search(
+                searchRecord=search_record,
+                _soapheaders=self._soap_headers(searchPreferences=search_prefs),
+            )
 
             logger.info(
                 "Search completed",
@@ -256,7 +404,7 @@ class NetSuiteSoapClient:
                 record_type=record_ref.type if hasattr(record_ref, "type") else None,
             )
 
-            response = self.service.get(baseRef=record_ref)
+            response = self.service.get(baseRef=record_ref, _soapheaders=self._soap_headers())
 
             if hasattr(response, "status") and not response.status.isSuccess:
                 raise NetSuiteError(
@@ -281,7 +429,7 @@ class NetSuiteSoapClient:
         try:
             logger.info("Adding record", record_type=type(record).__name__)
 
-            response = self.service.add(record=record)
+            response = self.service.add(record=record, _soapheaders=self._soap_headers())
 
             if hasattr(response, "status") and not response.status.isSuccess:
                 raise NetSuiteError(
@@ -310,7 +458,7 @@ class NetSuiteSoapClient:
                 internal_id=record.internalId if hasattr(record, "internalId") else None,
             )
 
-            response = self.service.update(record=record)
+            response = self.service.update(record=record, _soapheaders=self._soap_headers())
 
             if hasattr(response, "status") and not response.status.isSuccess:
                 raise NetSuiteError(
@@ -339,7 +487,7 @@ class NetSuiteSoapClient:
                 record_type=record_ref.type if hasattr(record_ref, "type") else None,
             )
 
-            response = self.service.delete(baseRef=record_ref)
+            response = self.service.delete(baseRef=record_ref, _soapheaders=self._soap_headers())
 
             if hasattr(response, "status") and not response.status.isSuccess:
                 raise NetSuiteError(
@@ -354,19 +502,38 @@ class NetSuiteSoapClient:
 
     def _handle_soap_error(self, error: Exception) -> None:
         """Handle SOAP errors and raise appropriate exceptions."""
+        from requests.exceptions import Timeout  # noqa: PLC0415
+        from zeep.exceptions import Fault, TransportError  # noqa: PLC0415
+
+        if isinstance(error, Timeout):
+            raise NetSuiteTimeoutError("SOAP", self.timeout)
+        if isinstance(error, Fault):
+            message = cast("str | None", error.message) or str(error)
+            # NetSuite wraps most failures, rejected logins included, in a generic
+            # Server.userException fault with the specific code in its detail
+            fault_code = (
+                _platform_fault_code(cast("Any", error.detail))
+                or cast("str | None", error.code)
+                or "Unknown"
+            )
+            if fault_code in AUTH_FAULT_CODES or "invalid login" in message.lower():
+                raise AuthenticationError("NetSuite authentication failed")
+            raise SOAPFaultError(fault_code, message)
+        if isinstance(error, TransportError) and error.status_code in (401, 403):
+            raise AuthenticationError("NetSuite authentication failed")
+
+        # Fall back to inspecting the message for errors raised outside zeep/requests
         error_str = str(error)
+        error_lower = error_str.lower()
 
-        if "timeout" in error_str.lower():
+        if "timeout" in error_lower:
             raise NetSuiteTimeoutError("SOAP", self.timeout)
-        if "authentication" in error_str.lower() or "invalid login" in error_str.lower():
+        if "authentication" in error_lower or "invalid login" in error_lower:
             raise AuthenticationError("NetSuite authentication failed")
         if hasattr(error, "fault"):
-            # SOAP fault - handle zeep.exceptions.Fault
-            try:
-                fault = error.fault
-                fault_code = fault.faultcode if hasattr(fault, "faultcode") else "Unknown"
-                fault_string = fault.faultstring if hasattr(fault, "faultstring") else str(error)
-                raise SOAPFaultError(fault_code, fault_string)
-            except AttributeError:
-                raise SOAPFaultError("Unknown", str(error)) from None
+            # Objects exposing a SOAP fault as an attribute
+            fault: object = getattr(error, "fault", None)
+            fault_code = str(getattr(fault, "faultcode", "Unknown"))
+            fault_string = str(getattr(fault, "faultstring", error_str))
+            raise SOAPFaultError(fault_code, fault_string)
         raise NetSuiteError(f"NetSuite SOAP error: {error_str}")
@@ -1,9 +1,8 @@
 """Protocol definitions for type safety and testability."""
 
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol
 
 
-@runtime_checkable
 class NetSuiteClient(Protocol):
     """Protocol for NetSuite client implementations."""
 
@@ -28,7 +27,6 @@ class NetSuiteClient(Protocol):
         ...
 
 
-@runtime_checkable
 class Serializer(Protocol):
     """Protocol for data serializers."""
 
@@ -42,7 +40,6 @@ class Serializer(Protocol):
         ...
 
 
-@runtime_checkable
 class AuthenticationProvider(Protocol):
     """Protocol for authentication providers."""
 
@@ -146,6 +146,15 @@ class PaginationInfo(TypedDict):
     has_previous: bool
 
 
+class NetSuitePaginationHeaders(TypedDict):
+    """Pagination details read from NetSuite response headers."""
+
+    search_id: str | None
+    total_records: int
+    total_pages: int
+    page_size: int
+
+
 class ListResponse(TypedDict):
     """Generic list response with pagination."""
 
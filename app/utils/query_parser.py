@@ -5,6 +5,10 @@ This module provides utilities for parsing and converting various query paramete
 formats used in the NetSuite API.
 """
 
+import contextlib
+import math
+import re
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from typing import Any, cast
 
@@ -12,49 +16,75 @@ import pendulum
 from pendulum.parsing.exceptions import ParserError
 
 from app.core.logging import get_logger
+from app.types import NetSuitePaginationHeaders
 
 logger = get_logger(__name__)
 
+# Plain comma-separated IDs with no ranges, e.g. "1,2,-3" or "1, 2, 3";
+# int() ignores the whitespace around each ID
+_CSV_INTS = re.compile(r"\s*-?\d+\s*(?:,\s*-?\d+\s*)*")
+
+# Decimal or scientific-notation numbers, e.g. "12", "-1.5", ".5", "1.23e2"
+_DECIMAL_FLOAT = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+# Numeric pagination fields: (result key, NetSuite response header, default)
+_PAGINATION_HEADERS: tuple[tuple[str, str, int], ...] = (
+    ("total_records", "NETSUITE-TOTAL-RECORDS", 0),
+    ("total_pages", "NETSUITE-TOTAL-PAGES", 0),
+    ("page_size", "NETSUITE-PAGE-SIZE", 20),
+)
+
+# Accepted spellings for boolean query parameters, mapped to their value
+_BOOLEAN_VALUES: Mapping[str, bool] = {
+    "true": True,
+    "yes": True,
+    "1": True,
+    "on": True,
+    "t": True,
+    "y": True,
+    "false": False,
+    "no": False,
+    "0": False,
+    "off": False,
+    "f": False,
+    "n": False,
+}
+
+
+def _is_range_bound(bound: str) -> bool:
+    """Check whether a string is an optionally negative run of digits."""
+    return (bound[1:] if bound[:1] == "-" else bound).isdecimal()
+
 
 def _parse_range(part: str) -> tuple[int, int] | None:
     """Parse a potential range string like '1-100' or '-5--1'."""
-    if "-" not in part:
+    # The separator is the first hyphen after a possible leading minus sign
+    sep = part.find("-", 1)
+    if sep < 0:
         return None
 
-    # Handle negative numbers in ranges
-    if part.startswith("-"):
-        remaining = part[1:]
-        if "-" in remaining:
-            idx = remaining.index("-")
-            try:
-                start = int("-" + remaining[:idx])
-                end = int(remaining[idx + 1 :])
-                return (start, end)
-            except ValueError:
-                return None
-    else:
-        # Positive start
-        idx = part.index("-")
-        if idx > 0:
-            try:
-                start = int(part[:idx])
-                end = int(part[idx + 1 :])
-                return (start, end)
-            except ValueError:
-                return None
+    start, end = part[:sep].rstrip(), part[sep + 1 :].lstrip()
+    if not (_is_range_bound(start) and _is_range_bound(end)):
+        return None
+    # int() can still reject a bound longer than the interpreter's digit limit
+    with contextlib.suppress(ValueError):
+        return (int(start), int(end))
     return None
 
 
 def _parse_single_id(part: str) -> int | None:
     """Parse a single ID string."""
-    try:
-        return int(part)
-    except ValueError:
-        logger.warning("Failed to parse ID", id_str=part)
-        return None
+    # Check the shape first so malformed IDs don't pay for a raised ValueError;
+    # int() can still reject an ID longer than the interpreter's digit limit
+    digits = part[1:] if part[:1] in ("-", "+") else part
+    if digits.isdecimal():
+        with contextlib.suppress(ValueError):
+            return int(part)
+    logger.debug("Failed to parse ID", id_str=part)
+    return None
 
 
-def _process_id_range(start: int, end: int, part: str) -> list[int]:
+def _process_id_range(start: int, end: int, part: str) -> range:
     """Process an ID range, with validation and limits."""
     if start > end:
         logger.warning(
@@ -63,7 +93,7 @@ def _process_id_range(start: int, end: int, part: str) -> list[int]:
             start=start,
             end=end,
         )
-        return []
+        return range(0)
 
     # Limit range size to prevent memory issues
     if end - start > 10000:
@@ -75,7 +105,7 @@ def _process_id_range(start: int, end: int, part: str) -> list[int]:
         )
         end = start + 10000
 
-    return list(range(start, end + 1))
+    return range(start, end + 1)
 
 
 def parse_id_parameter(ids_param: str | None) -> list[int] | None:
@@ -103,6 +133,12 @@ def parse_id_parameter(ids_param: str | None) -> list[int] | None:
     if ids_str.startswith("[") and ids_str.endswith("]"):
         ids_str = ids_str[1:-1]
 
+    # Fast path for the common shape, converting every ID in one C-level pass;
+    # an ID past the interpreter's digit limit makes int() raise and falls through
+    if _CSV_INTS.fullmatch(ids_str):
+        with contextlib.suppress(ValueError):
+            return list(map(int, ids_str.split(",")))
+
     result: list[int] = []
     parts = ids_str.split(",")
 
@@ -138,7 +174,8 @@ def parse_field_list(fields_param: str | None) -> list[str] | None:
     if not fields_param:
         return None
 
-    fields = [f.strip() for f in fields_param.split(",") if f.strip()]
+    # Strip each field once, dropping empties from doubled or trailing commas
+    fields = [field for f in fields_param.split(",") if (field := f.strip())]
     return fields if fields else None
 
 
@@ -159,41 +196,42 @@ def parse_date_param(date_str: str | None) -> datetime | None:
     Returns:
         Parsed datetime with timezone or None if invalid
     """
-    if not date_str:
-        return None
-
-    date_str = date_str.strip()
+    date_str = (date_str or "").strip()
 
     # Check for empty string after stripping
     if not date_str:
         return None
 
+    # Fast path: ISO 8601, including date-only strings (parsed as midnight)
+    try:
+        dt = datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    else:
+        return dt if dt.tzinfo is not None else dt.replace(tzinfo=UTC)
+
+    # For ambiguous dates like 01/02/2024 (Jan 2 or Feb 1?)
+    # Try US format first (MM/DD/YYYY), then European (DD/MM/YYYY)
+    if "/" in date_str and len(date_str) == 10:
+        parts = date_str.split("/")
+        if len(parts) == 3:
+            first, second, year = parts
+            try:
+                return datetime(int(year), int(first), int(second), tzinfo=UTC)
+            except ValueError:
+                try:
+                    return datetime(int(year), int(second), int(first), tzinfo=UTC)
+                except ValueError:
+                    pass
+
     try:
-        # Pendulum automatically handles timezone-aware parsing
-        # and can parse many formats including ISO, US, European dates
+        # Fall back to pendulum for any other format it understands
         # Pendulum DateTime is already a datetime.datetime subclass
         return cast("datetime", pendulum.parse(date_str, tz="UTC"))
     except (ParserError, ValueError):
-        # For ambiguous dates like 01/02/2024 (Jan 2 or Feb 1?)
-        # Try US format first (MM/DD/YYYY), then European (DD/MM/YYYY)
-        if "/" in date_str and len(date_str) == 10:
-            parts = date_str.split("/")
-            if len(parts) == 3:
-                try:
-                    # Try US format: MM/DD/YYYY
-                    month, day, year = parts
-                    dt = pendulum.datetime(int(year), int(month), int(day), tz="UTC")
-                    return cast("datetime", dt)
-                except (ValueError, ParserError):
-                    try:
-                        # Try European format: DD/MM/YYYY
-                        day, month, year = parts
-                        dt = pendulum.datetime(int(year), int(month), int(day), tz="UTC")
-                        return cast("datetime", dt)
-                    except (ValueError, ParserError):
-                        pass
-
-    logger.warning("Failed to parse date", date_str=date_str)
+        pass
+
+    logger.debug("Failed to parse date", date_str=date_str)
     return None
 
 
@@ -212,23 +250,16 @@ def parse_boolean_param(bool_str: str | None) -> bool | None:
     if not bool_str:
         return None
 
-    bool_str = bool_str.strip().lower()
-
-    true_values = {"true", "yes", "1", "on", "t", "y"}
-    false_values = {"false", "no", "0", "off", "f", "n"}
-
-    if bool_str in true_values:
-        return True
-    if bool_str in false_values:
-        return False
-
-    return None
+    return _BOOLEAN_VALUES.get(bool_str.strip().lower())
 
 
 def parse_float_param(float_str: str | None) -> float | None:
     """
     Parse float parameter.
 
+    Accepts plain decimal and scientific notation; "nan", "inf" and values that
+    overflow to infinity are rejected.
+
     Args:
         float_str: Float string to parse
 
@@ -238,11 +269,27 @@ def parse_float_param(float_str: str | None) -> float | None:
     if not float_str:
         return None
 
-    try:
-        return float(float_str.strip())
-    except ValueError:
-        logger.warning("Failed to parse float", float_str=float_str)
-        return None
+    # Check the shape first so invalid values don't pay for a raised ValueError
+    value = float_str.strip()
+    if _DECIMAL_FLOAT.fullmatch(value) and math.isfinite(result := float(value)):
+        return result
+    logger.debug("Failed to parse float", float_str=float_str)
+    return None
+
+
+def _search_value(value: object) -> object:
+    """Convert a filter value to its NetSuite search value."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+# Date range filters: (query parameter, NetSuite field, operator).
+# Later entries win when two parameters target the same field.
+_DATE_FILTERS: tuple[tuple[str, str, str], ...] = (
+    ("created_since", "dateCreated", "onOrAfter"),
+    ("created_before", "dateCreated", "before"),
+    ("updated_since", "lastModifiedDate", "onOrAfter"),
+    ("updated_before", "lastModifiedDate", "before"),
+)
 
 
 def build_netsuite_filter(params: dict[str, Any]) -> dict[str, Any]:
@@ -255,40 +302,15 @@ def build_netsuite_filter(params: dict[str, Any]) -> dict[str, Any]:
     Returns:
         NetSuite-compatible filter dictionary
     """
+    if not params:
+        return {}
+
     filters: dict[str, Any] = {}
 
     # Date range filters
-    if created_since := params.get("created_since"):
-        filters["dateCreated"] = {
-            "operator": "onOrAfter",
-            "searchValue": created_since.isoformat()
-            if isinstance(created_since, datetime)
-            else created_since,
-        }
-
-    if created_before := params.get("created_before"):
-        filters["dateCreated"] = {
-            "operator": "before",
-            "searchValue": created_before.isoformat()
-            if isinstance(created_before, datetime)
-            else created_before,
-        }
-
-    if updated_since := params.get("updated_since"):
-        filters["lastModifiedDate"] = {
-            "operator": "onOrAfter",
-            "searchValue": updated_since.isoformat()
-            if isinstance(updated_since, datetime)
-            else updated_since,
-        }
-
-    if updated_before := params.get("updated_before"):
-        filters["lastModifiedDate"] = {
-            "operator": "before",
-            "searchValue": updated_before.isoformat()
-            if isinstance(updated_before, datetime)
-            else updated_before,
-        }
+    for param, field, operator in _DATE_FILTERS:
+        if value := params.get(param):
+            filters[field] = {"operator": operator, "searchValue": _search_value(value)}
 
     # ID filters
     if ids := params.get("ids"):
@@ -315,7 +337,7 @@ def build_netsuite_filter(params: dict[str, Any]) -> dict[str, Any]:
     return filters
 
 
-def extract_pagination_info(response_headers: dict[str, str]) -> dict[str, Any]:
+def extract_pagination_info(response_headers: Mapping[str, str]) -> NetSuitePaginationHeaders:
     """
     Extract pagination information from NetSuite response headers.
 
@@ -323,14 +345,15 @@ def extract_pagination_info(response_headers: dict[str, str]) -> dict[str, Any]:
         response_headers: HTTP response headers
 
     Returns:
-        Dictionary with pagination information
+        Pagination information with every count filled in
     """
-    return {
-        "search_id": response_headers.get("NETSUITE-SEARCH-ID"),
-        "total_records": int(response_headers.get("NETSUITE-TOTAL-RECORDS", "0")),
-        "total_pages": int(response_headers.get("NETSUITE-TOTAL-PAGES", "0")),
-        "page_size": int(response_headers.get("NETSUITE-PAGE-SIZE", "20")),
-    }
+    pagination: dict[str, Any] = {"search_id": response_headers.get("NETSUITE-SEARCH-ID")}
+    for key, header, default in _PAGINATION_HEADERS:
+        value = response_headers.get(header, "").strip()
+        # Missing or malformed counts fall back to the default rather than raising
+        pagination[key] = int(value) if value.isdecimal() else default
+    # _PAGINATION_HEADERS supplies exactly the remaining NetSuitePaginationHeaders keys
+    return cast("NetSuitePaginationHeaders", pagination)
 
 
 def format_netsuite_timestamp(dt: datetime) -> str:
@@ -345,8 +368,8 @@ def format_netsuite_timestamp(dt: datetime) -> str:
     Returns:
         Formatted timestamp string
     """
-    # NetSuite typically expects ISO format without timezone
-    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+    # NetSuite typically expects ISO format without timezone or fractional seconds
+    return dt.replace(tzinfo=None).isoformat(timespec="seconds")
 
 
 def parse_netsuite_timestamp(timestamp_str: str | None) -> datetime | None:
@@ -375,13 +398,10 @@ def parse_netsuite_timestamp(timestamp_str: str | None) -> datetime | None:
 
     # Try without timezone
     try:
-        # Remove timezone suffix if present
-        if "+" in timestamp_str or timestamp_str.count("-") > 2:
-            # Find the last occurrence of + or -
-            for i in range(len(timestamp_str) - 1, -1, -1):
-                if timestamp_str[i] in "+-":
-                    timestamp_str = timestamp_str[:i]
-                    break
+        # Remove timezone suffix if present: the last + or - after the date portion
+        idx = max(timestamp_str.rfind("+"), timestamp_str.rfind("-", 10))
+        if idx > 10:
+            timestamp_str = timestamp_str[:idx]
 
         dt = datetime.fromisoformat(timestamp_str)
         # If no timezone, assume UTC
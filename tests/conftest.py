@@ -3,10 +3,12 @@ Shared pytest fixtures and configuration.
 """
 
 import os
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
+import httpx
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.types import HeaderDict
@@ -15,24 +17,109 @@ from app.types import HeaderDict
 os.environ["ENVIRONMENT"] = "test"
 os.environ["SECRET_KEY_BASE"] = "test-secret-key-for-tests-that-is-32-characters"
 
-from app.core.config import get_settings
-from app.main import create_app
+from app.core.config import NetSuiteConfig, get_settings
+
+# NetSuite settings the developer's shell may export, both the nested
+# (NETSUITE__ACCOUNT) and flat (NETSUITE_ACCOUNT) spellings
+_NETSUITE_ENV_VARS: frozenset[str] = frozenset(
+    f"NETSUITE{delimiter}{field.upper()}"
+    for field in NetSuiteConfig.model_fields
+    for delimiter in ("_", "__")
+)
+
+# Strip them once so ambient credentials can't leak into any test's settings;
+# only the variables that are actually set are touched
+for _var in _NETSUITE_ENV_VARS & os.environ.keys():
+    del os.environ[_var]
+
+from app.main import create_app  # noqa: E402 - settings are built at import time
 
 
 @pytest.fixture
-def client() -> Generator[TestClient]:
-    """Create a test client."""
+def monkeypatch(monkeypatch: pytest.MonkeyPatch) -> Generator[pytest.MonkeyPatch]:
+    """Built-in monkeypatch that invalidates cached settings when env vars change.
+
+    Only tests that actually touch the environment pay for a settings reload.
+    """
+    environ_before = dict(os.environ)
+    yield monkeypatch
+    # monkeypatch restores the environment after this teardown, so settings
+    # built from patched values must not outlive the test
+    if os.environ != environ_before:
+        get_settings.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def session_app() -> Generator[FastAPI]:
+    """Create one app shared by the whole session.
+
+    Building the app once keeps per-test cost down; tests that need a
+    differently configured app should build their own.
+    """
     # Clear cache to ensure fresh settings
     get_settings.cache_clear()
 
-    app = create_app()
-    with TestClient(app) as test_client:
-        yield test_client
+    yield create_app()
 
-    # Clear cache after test
+    # Clear cache after the session
     get_settings.cache_clear()
 
 
+@pytest.fixture(scope="session")
+def session_client(session_app: FastAPI) -> Generator[TestClient]:
+    """Create a test client for the shared app, running its startup once."""
+    with TestClient(session_app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client(session_app: FastAPI, session_client: TestClient) -> Generator[TestClient]:
+    """Get the shared test client, resetting per-test app state afterwards."""
+    yield session_client
+
+    session_app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def async_client(
+    session_app: FastAPI,
+    session_client: TestClient,  # noqa: ARG001 - runs the app's lifespan
+) -> AsyncGenerator[httpx.AsyncClient]:
+    """Get an in-process async client for the shared app.
+
+    Requests run on the test's own event loop instead of hopping through the
+    TestClient's portal thread. ``session_client`` is requested so the app's
+    lifespan has already run.
+    """
+    transport = httpx.ASGITransport(app=session_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
+
+    session_app.dependency_overrides.clear()
+
+
+# Known-valid NetSuite configs built with model_construct, which skips env loading
+# and validation; the validators themselves are exercised in test_config.py
+@pytest.fixture(scope="session")
+def password_cfg() -> NetSuiteConfig:
+    """Password-authenticated config, shared by the session."""
+    return NetSuiteConfig.model_construct(
+        account="TEST123", email="test@example.com", password="password"
+    )
+
+
+@pytest.fixture(scope="session")
+def oauth_cfg() -> NetSuiteConfig:
+    """OAuth-authenticated config, shared by the session."""
+    return NetSuiteConfig.model_construct(
+        account="TEST123",
+        consumer_key="key",
+        consumer_secret="secret",
+        token_id="token",
+        token_secret="tokensecret",
+    )
+
+
 @pytest.fixture
 def netsuite_auth_headers() -> HeaderDict:
     """Standard NetSuite password auth headers for testing."""
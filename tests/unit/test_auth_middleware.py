@@ -7,17 +7,11 @@ from fastapi import Depends, FastAPI, Request
 from fastapi.testclient import TestClient
 
 from app.api.middleware import NetSuiteAuthMiddleware, get_netsuite_auth
-from app.main import app
 
 
 class TestNetSuiteAuthMiddleware:
     """Tests for NetSuite authentication middleware."""
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client."""
-        return TestClient(app)
-
     @pytest.fixture
     def test_app(self) -> FastAPI:
         """Create a test app with auth endpoint."""
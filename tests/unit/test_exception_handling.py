@@ -1,8 +1,8 @@
 """Tests for exception handling and status code mapping."""
 
+import httpx
 import pytest
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
+from fastapi import APIRouter, FastAPI
 
 from app.core.exceptions import (
     AuthenticationError,
@@ -13,114 +13,138 @@ from app.core.exceptions import (
     RecordNotFoundError,
     ValidationError,
 )
-from app.main import create_app
+
+# Endpoints that raise each exception, built once at import time
+error_router = APIRouter(prefix="/api/test")
+
+
+@error_router.get("/auth-error")
+async def raise_auth_error():
+    raise AuthenticationError("Invalid credentials")
+
+
+@error_router.get("/permission-error")
+async def raise_permission_error():
+    raise NetSuitePermissionError("Access denied")
+
+
+@error_router.get("/not-found")
+async def raise_not_found():
+    raise RecordNotFoundError("Customer", "123")
+
+
+@error_router.get("/page-bounds")
+async def raise_page_bounds():
+    raise PageBoundsError(10, 5)
+
+
+@error_router.get("/validation-error")
+async def raise_validation():
+    raise ValidationError("email", "invalid@", "Invalid email format")
+
+
+@error_router.get("/rate-limit")
+async def raise_rate_limit():
+    raise RateLimitError(60)
+
+
+@error_router.get("/generic-error")
+async def raise_generic():
+    raise NetSuiteError("Something went wrong")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def error_endpoints(session_app: FastAPI) -> None:
+    """Include the error endpoints on the shared app once for this module."""
+    session_app.include_router(error_router)
 
 
 class TestExceptionHandling:
     """Test exception handling and status code mapping."""
 
-    @pytest.fixture
-    def app(self) -> FastAPI:
-        """Create test app with exception handlers."""
-        return create_app()
-
-    @pytest.fixture
-    def client(self, app: FastAPI) -> TestClient:
-        """Create test client."""
-
-        # Add test endpoints that raise exceptions
-        @app.get("/api/test/auth-error")
-        async def raise_auth_error():  # pyright: ignore[reportUnusedFunction]
-            raise AuthenticationError("Invalid credentials")
-
-        @app.get("/api/test/permission-error")
-        async def raise_permission_error():  # pyright: ignore[reportUnusedFunction]
-            raise NetSuitePermissionError("Access denied")
-
-        @app.get("/api/test/not-found")
-        async def raise_not_found():  # pyright: ignore[reportUnusedFunction]
-            raise RecordNotFoundError("Customer", "123")
-
-        @app.get("/api/test/page-bounds")
-        async def raise_page_bounds():  # pyright: ignore[reportUnusedFunction]
-            raise PageBoundsError(10, 5)
-
-        @app.get("/api/test/validation-error")
-        async def raise_validation():  # pyright: ignore[reportUnusedFunction]
-            raise ValidationError("email", "invalid@", "Invalid email format")
-
-        @app.get("/api/test/rate-limit")
-        async def raise_rate_limit():  # pyright: ignore[reportUnusedFunction]
-            raise RateLimitError(60)
-
-        @app.get("/api/test/generic-error")
-        async def raise_generic():  # pyright: ignore[reportUnusedFunction]
-            raise NetSuiteError("Something went wrong")
-
-        return TestClient(app)
-
-    def test_authentication_error_returns_401(self, client: TestClient):
-        """Test that AuthenticationError returns 401."""
-        response = client.get("/api/test/auth-error")
-        assert response.status_code == 401
-        data = response.json()
-        assert data["error"] == "Invalid credentials"
-        assert data["error_type"] == "AuthenticationError"
-        assert data["details"] == {}
-
-    def test_permission_error_returns_403(self, client: TestClient):
-        """Test that NetSuitePermissionError returns 403."""
-        response = client.get("/api/test/permission-error")
-        assert response.status_code == 403
-        data = response.json()
-        assert data["error"] == "Access denied"
-        assert data["error_type"] == "NetSuitePermissionError"
-
-    def test_not_found_error_returns_404(self, client: TestClient):
-        """Test that RecordNotFoundError returns 404."""
-        response = client.get("/api/test/not-found")
-        assert response.status_code == 404
-        data = response.json()
-        assert data["error"] == "Customer with ID 123 not found"
-        assert data["error_type"] == "RecordNotFoundError"
-        assert data["details"]["record_type"] == "Customer"
-        assert data["details"]["record_id"] == "123"
-
-    def test_page_bounds_error_returns_400(self, client: TestClient):
-        """Test that PageBoundsError returns 400."""
-        response = client.get("/api/test/page-bounds")
-        assert response.status_code == 400
-        data = response.json()
-        assert data["error"] == "Page 10 is out of bounds. Total pages: 5"
-        assert data["error_type"] == "PageBoundsError"
-        assert data["details"]["page"] == 10
-        assert data["details"]["total_pages"] == 5
-
-    def test_validation_error_returns_400(self, client: TestClient):
-        """Test that ValidationError returns 400."""
-        response = client.get("/api/test/validation-error")
-        assert response.status_code == 400
-        data = response.json()
-        assert data["error"] == "Validation error for field 'email': Invalid email format"
-        assert data["error_type"] == "ValidationError"
-        assert data["details"]["field"] == "email"
-        assert data["details"]["value"] == "invalid@"
-        assert data["details"]["reason"] == "Invalid email format"
-
-    def test_rate_limit_error_returns_429(self, client: TestClient):
-        """Test that RateLimitError returns 429."""
-        response = client.get("/api/test/rate-limit")
-        assert response.status_code == 429
-        data = response.json()
-        assert data["error"] == "NetSuite API rate limit exceeded. Retry after 60 seconds"
-        assert data["error_type"] == "RateLimitError"
-        assert data["details"]["retry_after"] == 60
-
-    def test_generic_error_returns_500(self, client: TestClient):
-        """Test that generic NetSuiteError returns 500."""
-        response = client.get("/api/test/generic-error")
-        assert response.status_code == 500
-        data = response.json()
-        assert data["error"] == "Something went wrong"
-        assert data["error_type"] == "NetSuiteError"
-        assert data["details"] == {}
+    @pytest.mark.parametrize(
+        ("path", "status_code", "body"),
+        [
+            pytest.param(
+                "/api/test/auth-error",
+                401,
+                {
+                    "error": "Invalid credentials",
+                    "error_type": "AuthenticationError",
+                    "details": {},
+                },
+                id="authentication-401",
+            ),
+            pytest.param(
+                "/api/test/permission-error",
+                403,
+                {
+                    "error": "Access denied",
+                    "error_type": "NetSuitePermissionError",
+                    "details": {},
+                },
+                id="permission-403",
+            ),
+            pytest.param(
+                "/api/test/not-found",
+                404,
+                {
+                    "error": "Customer with ID 123 not found",
+                    "error_type": "RecordNotFoundError",
+                    "details": {"record_type": "Customer", "record_id": "123"},
+                },
+                id="not-found-404",
+            ),
+            pytest.param(
+                "/api/test/page-bounds",
+                400,
+                {
+                    "error": "Page 10 is out of bounds. Total pages: 5",
+                    "error_type": "PageBoundsError",
+                    "details": {"page": 10, "total_pages": 5},
+                },
+                id="page-bounds-400",
+            ),
+            pytest.param(
+                "/api/test/validation-error",
+                400,
+                {
+                    "error": "Validation error for field 'email': Invalid email format",
+                    "error_type": "ValidationError",
+                    "details": {
+                        "field": "email",
+                        "value": "invalid@",
+                        "reason": "Invalid email format",
+                    },
+                },
+                id="validation-400",
+            ),
+            pytest.param(
+                "/api/test/rate-limit",
+                429,
+                {
+                    "error": "NetSuite API rate limit exceeded. Retry after 60 seconds",
+                    "error_type": "RateLimitError",
+                    "details": {"retry_after": 60},
+                },
+                id="rate-limit-429",
+            ),
+            pytest.param(
+                "/api/test/generic-error",
+                500,
+                {
+                    "error": "Something went wrong",
+                    "error_type": "NetSuiteError",
+                    "details": {},
+                },
+                id="generic-500",
+            ),
+        ],
+    )
+    async def test_exception_mapping(
+        self, async_client: httpx.AsyncClient, path: str, status_code: int, body: dict[str, object]
+    ) -> None:
+        """Test that each NetSuite exception maps to its status code and error body."""
+        response = await async_client.get(path)
+        assert response.status_code == status_code
+        assert response.json() == body
@@ -2,15 +2,24 @@
 Tests for health check endpoints.
 """
 
-import pytest
-from fastapi.testclient import TestClient
+import httpx
+from fastapi import FastAPI
 
-from app.core.config import get_settings
+from app.core.config import NetSuiteConfig, get_netsuite_config
 
+# OAuth-configured NetSuite settings, built once for the tests that need them
+_OAUTH_CONFIG = NetSuiteConfig(
+    account="TEST123",
+    consumer_key="key",
+    consumer_secret="secret",
+    token_id="token",
+    token_secret="token_secret",
+)
 
-def test_health_check(client: TestClient) -> None:
+
+async def test_health_check(async_client: httpx.AsyncClient) -> None:
     """Test basic health check endpoint."""
-    response = client.get("/api/health")
+    response = await async_client.get("/api/health")
     assert response.status_code == 200
 
     data = response.json()
@@ -20,10 +29,10 @@ def test_health_check(client: TestClient) -> None:
     assert "environment" in data
 
 
-def test_detailed_health_check(client: TestClient) -> None:
+async def test_detailed_health_check(async_client: httpx.AsyncClient) -> None:
     """Test detailed health check endpoint."""
 
-    response = client.get("/api/health/detailed")
+    response = await async_client.get("/api/health/detailed")
     assert response.status_code == 200
 
     data = response.json()
@@ -43,25 +52,14 @@ def test_detailed_health_check(client: TestClient) -> None:
     assert "restlet_configured" in netsuite_data
 
 
-def test_health_check_with_oauth_auth(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_health_check_with_oauth_auth(
+    session_app: FastAPI, async_client: httpx.AsyncClient
+) -> None:
     """Test health check shows correct auth type for OAuth."""
-    # Set OAuth environment variables (using double underscore for nested config)
-    monkeypatch.setenv("SECRET_KEY_BASE", "test-secret-key-that-is-32-chars-long-test")
-    monkeypatch.setenv("NETSUITE__ACCOUNT", "TEST123")
-    monkeypatch.setenv("NETSUITE__CONSUMER_KEY", "key")
-    monkeypatch.setenv("NETSUITE__CONSUMER_SECRET", "secret")
-    monkeypatch.setenv("NETSUITE__TOKEN_ID", "token")
-    monkeypatch.setenv("NETSUITE__TOKEN_SECRET", "token_secret")
-
-    # Clear the settings cache
-    get_settings.cache_clear()
-
-    # Import and create client after setting env vars
-    from app.main import app  # noqa: PLC0415
-
-    client = TestClient(app)
+    # The async_client fixture clears this override after the test
+    session_app.dependency_overrides[get_netsuite_config] = lambda: _OAUTH_CONFIG
 
-    response = client.get("/api/health/detailed")
+    response = await async_client.get("/api/health/detailed")
     assert response.status_code == 200
 
     data = response.json()
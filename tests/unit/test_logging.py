@@ -1,51 +1,79 @@
 """Tests for structured logging configuration."""
 
+import json
 import logging
 
 import pytest
 import structlog
-from structlog.testing import LogCapture
+from structlog.testing import LogCapture, capture_logs
 
+from app.core.config import Settings
 from app.core.logging import add_request_context, configure_logging, get_logger
 
+# Settings injected straight into configure_logging, built once per module
+_DEVELOPMENT_SETTINGS = Settings(
+    secret_key_base="a" * 32,
+    environment="development",
+    debug=True,
+    log_level="DEBUG",
+)
+_PRODUCTION_SETTINGS = Settings(
+    secret_key_base="a" * 32,
+    environment="production",
+    debug=False,
+    log_level="INFO",
+    cors_origins=["https://example.com"],
+)
+
 
 class TestLoggingConfiguration:
     """Tests for logging configuration."""
 
-    def test_configure_logging_development(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_configure_logging_development(self) -> None:
         """Test logging configuration in development environment."""
-        # Set development environment
-        monkeypatch.setenv("ENVIRONMENT", "development")
-        monkeypatch.setenv("DEBUG", "true")
-        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
-
-        # Clear any existing configuration
-        structlog.reset_defaults()
-
         # Configure logging
-        configure_logging()
+        configure_logging(_DEVELOPMENT_SETTINGS)
 
         # Verify logger can be created
         logger = get_logger("test")
         assert logger is not None
 
-    def test_configure_logging_production(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_configure_logging_production(self) -> None:
         """Test logging configuration in production environment."""
-        # Set production environment
-        monkeypatch.setenv("ENVIRONMENT", "production")
-        monkeypatch.setenv("DEBUG", "false")
-        monkeypatch.setenv("LOG_LEVEL", "INFO")
-
-        # Clear any existing configuration
-        structlog.reset_defaults()
-
         # Configure logging
-        configure_logging()
+        configure_logging(_PRODUCTION_SETTINGS)
 
         # Create a logger
         logger = get_logger("test")
         assert logger is not None
 
+    def test_configure_logging_production_renders_json(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test production logs are rendered as JSON lines."""
+        configure_logging(_PRODUCTION_SETTINGS)
+
+        logger = get_logger("test")
+        with caplog.at_level(logging.INFO):
+            logger.info("Test message", key="value", ids={1: "one"})
+
+        event = json.loads(caplog.records[-1].getMessage())
+        assert event["event"] == "Test message"
+        assert event["key"] == "value"
+        assert event["ids"] == {"1": "one"}
+
+    def test_configure_logging_drops_events_below_level(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test events below the configured level are dropped before rendering."""
+        configure_logging(_PRODUCTION_SETTINGS)
+
+        logger = get_logger("test")
+        with caplog.at_level(logging.DEBUG):
+            logger.debug("Dropped message")
+
+        assert not caplog.records
+
     def test_get_logger_with_context(self) -> None:
         """Test getting logger with bound context."""
         logger = get_logger("test", user_id="123", request_id="abc")
@@ -80,56 +108,52 @@ class TestLoggingConfiguration:
             "client_ip": None,
         }
 
-    def test_logger_output_format(self, caplog: pytest.LogCaptureFixture) -> None:
-        """Test that logger outputs in expected format."""
-        # Configure for console output
-        structlog.reset_defaults()
-        configure_logging()
-
-        # Get logger and log a message
+    def test_logger_output_format(self) -> None:
+        """Test that logger emits the expected structured event."""
         logger = get_logger("test")
-        with caplog.at_level(logging.INFO):
+        with capture_logs() as cap:
             logger.info("Test message", key="value", number=42)
 
-        # Verify output contains expected elements
-        assert "Test message" in caplog.text
-        assert "key" in caplog.text
-        assert "value" in caplog.text
-
-    def test_logger_exception_formatting(self, caplog: pytest.LogCaptureFixture) -> None:
-        """Test that exceptions are properly formatted."""
-        structlog.reset_defaults()
-        configure_logging()
+        assert cap[0]["event"] == "Test message"
+        assert cap[0]["key"] == "value"
+        assert cap[0]["number"] == 42
 
+    def test_logger_exception_formatting(self) -> None:
+        """Test that exceptions are attached to the logged event."""
         logger = get_logger("test")
 
-        with caplog.at_level(logging.ERROR):
+        with capture_logs() as cap:
             try:
                 raise ValueError("Test exception")
             except ValueError:
                 logger.exception("Error occurred")
 
-        assert "Error occurred" in caplog.text
-        assert "ValueError" in caplog.text
-        assert "Test exception" in caplog.text
+        assert cap[0]["event"] == "Error occurred"
+        assert cap[0]["log_level"] == "error"
+        assert cap[0]["exc_info"] is True
+
+
+@pytest.fixture(scope="class")
+def structlog_capture() -> LogCapture:
+    """Configure structlog to capture events, once per test class."""
+    capture = LogCapture()
+    structlog.configure(
+        processors=[capture],
+        logger_factory=structlog.PrintLoggerFactory(),
+    )
+    return capture
+
+
+@pytest.fixture
+def log_capture(structlog_capture: LogCapture) -> LogCapture:
+    """Fixture to capture structured logs, emptied before each test."""
+    structlog_capture.entries.clear()
+    return structlog_capture
 
 
 class TestStructuredLogging:
     """Tests for structured logging functionality."""
 
-    @pytest.fixture
-    def log_capture(self) -> LogCapture:
-        """Fixture to capture structured logs."""
-        return LogCapture()
-
-    @pytest.fixture(autouse=True)
-    def configure_test_logging(self, log_capture: LogCapture) -> None:
-        """Configure structlog for testing."""
-        structlog.configure(
-            processors=[log_capture],
-            logger_factory=structlog.PrintLoggerFactory(),
-        )
-
     def test_structured_log_output(self, log_capture: LogCapture) -> None:
         """Test that logs are properly structured."""
         logger = get_logger("test")
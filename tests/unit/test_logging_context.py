@@ -1,12 +1,16 @@
 """Tests for request context logging."""
 
+import contextvars
 import logging
+from collections.abc import Callable
 from unittest.mock import Mock, patch
 
 import pytest
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from starlette.types import Receive, Scope, Send
 
+from app.api.middleware.logging import RequestLoggingMiddleware
 from app.core.logging import (
     clear_request_context,
     configure_logging,
@@ -14,13 +18,20 @@ from app.core.logging import (
     request_context_var,
     set_request_context,
 )
-from app.main import create_app
+
+
+@pytest.fixture
+def isolated_ctx() -> Callable[[Callable[[], None]], None]:
+    """Run a test body in a copy of the current context, discarding its ContextVar changes."""
+    return contextvars.copy_context().run
 
 
 class TestLoggingContext:
     """Test request context logging functionality."""
 
-    def test_request_context_injection(self):
+    def test_request_context_injection(
+        self, isolated_ctx: Callable[[Callable[[], None]], None]
+    ) -> None:
         """Test that request context is injected into logs."""
         # Configure logging
         configure_logging()
@@ -38,7 +49,6 @@ class TestLoggingContext:
             "path": "/test",
             "client_ip": "127.0.0.1",
         }
-        set_request_context(test_context)
 
         # Get logger and log a message
         logger = get_logger("test")
@@ -50,75 +60,79 @@ class TestLoggingContext:
         stdlib_logger.addHandler(handler)
         stdlib_logger.setLevel(logging.INFO)
 
-        try:
+        def log_in_request() -> None:
+            set_request_context(test_context)
             logger.info("Test message", extra_field="value")
 
+        try:
+            isolated_ctx(log_in_request)
+
             # Verify log output contains context
             assert len(log_output) > 0
-
-            # In JSON mode, we'd parse the JSON, but in dev mode it's formatted text
-            # For now, just verify the context was set and cleared
-            assert test_context == {
-                "request_id": "test-123",
-                "method": "GET",
-                "path": "/test",
-                "client_ip": "127.0.0.1",
-            }
+            assert "test-123" in log_output[-1]
 
         finally:
             stdlib_logger.removeHandler(handler)
-            clear_request_context()
 
-    def test_context_cleared_after_request(self):
+        # The context set inside the isolated run does not leak out
+        assert request_context_var.get() is None
+
+    def test_context_cleared_after_request(
+        self, isolated_ctx: Callable[[Callable[[], None]], None]
+    ) -> None:
         """Test that context is cleared after request."""
-        set_request_context({"request_id": "test-456"})
-        clear_request_context()
 
-        assert request_context_var.get() is None
+        def request() -> None:
+            set_request_context({"request_id": "test-456"})
+            clear_request_context()
+            assert request_context_var.get() is None
 
-    @pytest.fixture
-    def app(self) -> FastAPI:
-        """Create test app."""
-        return create_app()
+        isolated_ctx(request)
 
-    @pytest.fixture
-    def client(self, app: FastAPI) -> TestClient:
-        """Create test client."""
+    async def test_request_context_in_endpoint(self) -> None:
+        """Test that request context is available in endpoints."""
+        seen: list[dict[str, object] | None] = []
 
-        # Add test endpoint
-        async def test_logging_handler():
-            logger = get_logger(__name__)
-            logger.info("Test endpoint called", custom_field="test_value")
-            return {"status": "ok"}
+        async def stub_app(scope: Scope, receive: Receive, send: Send) -> None:
+            """ASGI app the middleware wraps; dispatch() is called directly."""
 
-        app.add_api_route("/api/test/logging", test_logging_handler, methods=["GET"])
+        async def call_next(_request: Request) -> Response:
+            seen.append(request_context_var.get())
+            return JSONResponse({"status": "ok"})
 
-        return TestClient(app)
+        request = Request(
+            {
+                "type": "http",
+                "method": "GET",
+                "path": "/api/test/logging",
+                "query_string": b"",
+                "headers": [],
+            }
+        )
 
-    def test_request_context_in_endpoint(self, client: TestClient):
-        """Test that request context is available in endpoints."""
         with patch("app.api.middleware.logging.get_logger") as mock_get_logger:
             mock_logger = Mock()
             mock_get_logger.return_value = mock_logger
 
-            response = client.get("/api/test/logging")
+            response = await RequestLoggingMiddleware(stub_app).dispatch(request, call_next)
 
-            assert response.status_code == 200
-            # Verify request ID header is set
-            assert "X-Request-ID" in response.headers
+        assert mock_logger.info.called
+        # Verify request ID header is set and matches the context the endpoint saw
+        assert "X-Request-ID" in response.headers
+        assert seen[0] is not None
+        assert seen[0]["request_id"] == response.headers["X-Request-ID"]
+        assert seen[0]["path"] == "/api/test/logging"
 
-    def test_multiple_concurrent_contexts(self):
+    def test_multiple_concurrent_contexts(self) -> None:
         """Test that contexts don't interfere with each other."""
-        # This would need async testing to properly test concurrent contexts
-        # For now, just verify sequential contexts work
-        set_request_context({"request_id": "ctx-1"})
-        ctx1 = {"request_id": "ctx-1"}
+        seen: list[dict[str, object] | None] = []
 
-        clear_request_context()
-        set_request_context({"request_id": "ctx-2"})
-        ctx2 = {"request_id": "ctx-2"}
+        def request(request_id: str) -> None:
+            set_request_context({"request_id": request_id})
+            seen.append(request_context_var.get())
 
-        # Verify they were different
-        assert ctx1 != ctx2
+        contextvars.copy_context().run(request, "ctx-1")
+        contextvars.copy_context().run(request, "ctx-2")
 
-        clear_request_context()
+        assert seen == [{"request_id": "ctx-1"}, {"request_id": "ctx-2"}]
+        assert request_context_var.get() is None
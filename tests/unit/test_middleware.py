@@ -1,22 +1,42 @@
 """Tests for API middleware."""
 
-import pytest
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
+from starlette.types import Receive, Scope, Send
 
-from app.main import app
+from app.api.middleware.logging import RequestLoggingMiddleware
+
+
+async def _stub_app(scope: Scope, receive: Receive, send: Send) -> None:
+    """ASGI app the middleware wraps; dispatch() is called directly so it never runs."""
+
+
+async def _call_next(_request: Request) -> Response:
+    """Stand in for the downstream app with an empty JSON response."""
+    return JSONResponse({})
+
+
+async def _dispatch(query_string: bytes = b"", headers: dict[str, str] | None = None) -> Response:
+    """Run a GET /api/health request through the middleware alone."""
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/health",
+            "query_string": query_string,
+            "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        }
+    )
+    return await RequestLoggingMiddleware(_stub_app).dispatch(request, _call_next)
 
 
 class TestRequestLoggingMiddleware:
     """Tests for request logging middleware."""
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client."""
-        return TestClient(app)
-
-    def test_request_id_header(self, client: TestClient) -> None:
+    async def test_request_id_header(self) -> None:
         """Test that X-Request-ID header is added to response."""
-        response = client.get("/api/health")
+        response = await _dispatch()
 
         assert response.status_code == 200
         assert "X-Request-ID" in response.headers
@@ -35,14 +55,14 @@ class TestRequestLoggingMiddleware:
 
         assert id1 != id2
 
-    def test_request_with_query_params(self, client: TestClient) -> None:
+    async def test_request_with_query_params(self) -> None:
         """Test that requests with query params work correctly."""
-        response = client.get("/api/health?test=true&foo=bar")
+        response = await _dispatch(query_string=b"test=true&foo=bar")
 
         assert response.status_code == 200
         assert "X-Request-ID" in response.headers
 
-    def test_request_with_headers(self, client: TestClient) -> None:
+    async def test_request_with_headers(self) -> None:
         """Test that requests with various headers work correctly."""
         headers = {
             "Authorization": "Bearer secret-token",
@@ -51,10 +71,11 @@ class TestRequestLoggingMiddleware:
             "X-Custom-Header": "custom-value",
         }
 
-        response = client.get("/api/health", headers=headers)
+        response = await _dispatch(headers=headers)
 
         assert response.status_code == 200
-        assert "X-Request-ID" in response.headers
+        # Header names come back lower-cased, so check them as one set
+        assert {"x-request-id", "content-type"} <= set(response.headers.keys())
 
     def test_request_error_handling(self, client: TestClient) -> None:
         """Test that middleware handles errors properly."""
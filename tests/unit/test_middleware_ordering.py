@@ -1,28 +1,14 @@
 """Tests for middleware ordering and interaction."""
 
-import pytest
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
-
-from app.main import create_app
+import httpx
 
 
 class TestMiddlewareOrdering:
     """Test that middleware executes in the correct order."""
 
-    @pytest.fixture
-    def app(self) -> FastAPI:
-        """Create test app."""
-        return create_app()
-
-    @pytest.fixture
-    def client(self, app: FastAPI) -> TestClient:
-        """Create test client."""
-        return TestClient(app, raise_server_exceptions=False)
-
-    def test_cors_preflight_request(self, client: TestClient):
+    async def test_cors_preflight_request(self, async_client: httpx.AsyncClient) -> None:
         """Test that CORS middleware handles preflight requests."""
-        response = client.options(
+        response = await async_client.options(
             "/api/health",
             headers={
                 "Origin": "http://localhost:3000",
@@ -37,7 +23,7 @@ class TestMiddlewareOrdering:
         assert "access-control-allow-methods" in response.headers
         assert "access-control-allow-headers" in response.headers
 
-    def test_request_id_available_in_auth_logs(self, client: TestClient):
+    async def test_request_id_available_in_auth_logs(self, async_client: httpx.AsyncClient) -> None:
         """Test that request ID is available when auth middleware logs."""
         # The original test was checking for X-Request-ID in response headers,
         # but this doesn't work when auth middleware returns early (401).
@@ -51,7 +37,7 @@ class TestMiddlewareOrdering:
         # 2. Ensure all middleware calls next() and handles auth differently
         #
         # For now, we test that successful requests get the X-Request-ID header
-        response = client.get(
+        response = await async_client.get(
             "/api/auth/info",
             headers={
                 "X-NetSuite-Account": "TEST123",
@@ -67,13 +53,15 @@ class TestMiddlewareOrdering:
         assert "X-Request-ID" in response.headers
         assert len(response.headers["X-Request-ID"]) == 36  # UUID format
 
-    def test_auth_middleware_has_request_context(self, client: TestClient):
+    async def test_auth_middleware_has_request_context(
+        self, async_client: httpx.AsyncClient
+    ) -> None:
         """Test that auth middleware can access request context from logging middleware."""
         # This is tested implicitly - if the middleware order was wrong,
         # the auth middleware wouldn't be able to log with request context
 
         # Make a valid auth request
-        response = client.get(
+        response = await async_client.get(
             "/api/auth/info",
             headers={
                 "X-NetSuite-Account": "TEST123",
@@ -85,9 +73,11 @@ class TestMiddlewareOrdering:
         assert response.status_code == 200
         assert "X-Request-ID" in response.headers
 
-    def test_all_middleware_execute_for_api_request(self, client: TestClient):
+    async def test_all_middleware_execute_for_api_request(
+        self, async_client: httpx.AsyncClient
+    ) -> None:
         """Test that all middleware execute for API requests."""
-        response = client.get(
+        response = await async_client.get(
             "/api/health",
             headers={"Origin": "http://localhost:3000"},
         )
@@ -98,20 +88,22 @@ class TestMiddlewareOrdering:
         # Request ID from logging middleware
         assert "X-Request-ID" in response.headers
 
-    def test_middleware_error_propagation(self, client: TestClient):
+    async def test_middleware_error_propagation(self, async_client: httpx.AsyncClient) -> None:
         """Test that errors propagate correctly through middleware."""
         # Missing account header should result in 400 from auth middleware
-        response = client.get("/api/auth/info")
+        response = await async_client.get("/api/auth/info")
 
         assert response.status_code == 400
         assert "Missing required header: X-NetSuite-Account" in response.json()["detail"]
         # Note: X-Request-ID is not present when auth middleware returns early
         # This is a known limitation of the current middleware design
 
-    def test_auth_failure_response(self, client: TestClient):
+    async def test_auth_failure_response(self, async_client: httpx.AsyncClient) -> None:
         """Test auth failure response behavior."""
         # Test with missing credentials (only account header)
-        response = client.get("/api/auth/info", headers={"X-NetSuite-Account": "TEST123"})
+        response = await async_client.get(
+            "/api/auth/info", headers={"X-NetSuite-Account": "TEST123"}
+        )
 
         # Should get 401 for missing credentials
         assert response.status_code == 401
@@ -2,54 +2,61 @@
 
 # pyright: reportPrivateUsage=false
 
+from types import MappingProxyType
+
 import pytest
 
 from app.core.config import NetSuiteConfig
 from app.core.exceptions import AuthenticationError
 from app.services.netsuite.auth import NetSuiteAuthService
 
+# Read-only request headers; tests copy and extend them per case
+BASE_OAUTH_HEADERS = MappingProxyType(
+    {
+        "x-netsuite-account": "TEST123",
+        "x-netsuite-consumer-key": "key",
+        "x-netsuite-consumer-secret": "secret",
+        "x-netsuite-token-id": "token",
+        "x-netsuite-token-secret": "tokensecret",
+    }
+)
+BASE_PASSWORD_HEADERS = MappingProxyType(
+    {
+        "x-netsuite-account": "TEST123",
+        "x-netsuite-email": "test@example.com",
+        "x-netsuite-password": "password",
+    }
+)
+BASE_RESTLET_HEADERS = MappingProxyType(
+    {
+        "x-netsuite-script-id": "customscript123",
+        "x-netsuite-deploy-id": "customdeploy1",
+    }
+)
+
 
 class TestNetSuiteAuthService:
     """Tests for NetSuiteAuthService."""
 
-    def test_init_with_oauth_config(self):
+    def test_init_with_oauth_config(self, oauth_cfg: NetSuiteConfig) -> None:
         """Test initialization with OAuth configuration."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            consumer_key="key",
-            consumer_secret="secret",
-            token_id="token",
-            token_secret="tokensecret",
-        )
-
-        service = NetSuiteAuthService(config)
+        service = NetSuiteAuthService(oauth_cfg)
 
-        assert service.config == config
+        assert service.config == oauth_cfg
         assert service._soap_client is None
         assert service._restlet_client is None
 
-    def test_init_with_password_config(self):
+    def test_init_with_password_config(self, password_cfg: NetSuiteConfig) -> None:
         """Test initialization with password configuration."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            email="test@example.com",
-            password="password",
-        )
-
-        service = NetSuiteAuthService(config)
+        service = NetSuiteAuthService(password_cfg)
 
-        assert service.config == config
+        assert service.config == password_cfg
         assert service._soap_client is None
         assert service._restlet_client is None
 
-    def test_get_account_info_production(self):
+    def test_get_account_info_production(self, password_cfg: NetSuiteConfig) -> None:
         """Test get_account_info for production account."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            email="test@example.com",
-            password="password",
-        )
-        service = NetSuiteAuthService(config)
+        service = NetSuiteAuthService(password_cfg)
 
         info = service.get_account_info()
 
@@ -84,42 +91,28 @@ class TestNetSuiteAuthService:
             "has_restlet": True,
         }
 
-    def test_determine_environment(self):
-        """Test environment determination."""
-        # Production accounts
-        for account in ["TEST123", "PROD456", "LIVE789"]:
-            config = NetSuiteConfig(account=account)
-            service = NetSuiteAuthService(config)
-            assert service._determine_environment() == "production"
-
-        # Sandbox accounts
-        for account in ["TEST_SB1", "TEST_SB2", "TEST-SB1", "TEST-SB2"]:
-            config = NetSuiteConfig(account=account)
-            service = NetSuiteAuthService(config)
-            assert service._determine_environment() == "sandbox"
-
-    def test_restlet_client_missing_config(self):
+    @pytest.mark.parametrize("account", ["TEST123", "PROD456", "LIVE789"])
+    def test_determine_environment_production(self, account: str) -> None:
+        """Test production accounts are detected."""
+        service = NetSuiteAuthService(NetSuiteConfig(account=account))
+        assert service._determine_environment() == "production"
+
+    @pytest.mark.parametrize("account", ["TEST_SB1", "TEST_SB2", "TEST-SB1", "TEST-SB2"])
+    def test_determine_environment_sandbox(self, account: str) -> None:
+        """Test sandbox accounts are detected."""
+        service = NetSuiteAuthService(NetSuiteConfig(account=account))
+        assert service._determine_environment() == "sandbox"
+
+    def test_restlet_client_missing_config(self, password_cfg: NetSuiteConfig) -> None:
         """Test restlet_client raises error when config is missing."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            email="test@example.com",
-            password="password",
-        )
-        service = NetSuiteAuthService(config)
+        service = NetSuiteAuthService(password_cfg)
 
         with pytest.raises(ValueError, match="RESTlet configuration missing"):
             _ = service.restlet_client
 
-    def test_from_headers_oauth(self):
+    def test_from_headers_oauth(self) -> None:
         """Test creating service from OAuth headers."""
-        headers = {
-            "x-netsuite-account": "TEST123",
-            "x-netsuite-consumer-key": "key",
-            "x-netsuite-consumer-secret": "secret",
-            "x-netsuite-token-id": "token",
-            "x-netsuite-token-secret": "tokensecret",
-            "x-netsuite-api-version": "2023_1",
-        }
+        headers = {**BASE_OAUTH_HEADERS, "x-netsuite-api-version": "2023_1"}
 
         service = NetSuiteAuthService.from_headers(headers)
 
@@ -131,14 +124,9 @@ class TestNetSuiteAuthService:
         assert service.config.token_secret == "tokensecret"
         assert service.config.api == "2023_1"
 
-    def test_from_headers_password(self):
+    def test_from_headers_password(self) -> None:
         """Test creating service from password headers."""
-        headers = {
-            "x-netsuite-account": "TEST123",
-            "x-netsuite-email": "test@example.com",
-            "x-netsuite-password": "password",
-            "x-netsuite-role": "3",
-        }
+        headers = {**BASE_PASSWORD_HEADERS, "x-netsuite-role": "3"}
 
         service = NetSuiteAuthService.from_headers(headers)
 
@@ -149,50 +137,43 @@ class TestNetSuiteAuthService:
         assert service.config.role == "3"
         assert service.config.api == "2024_2"  # Default
 
-    def test_from_headers_with_restlet_config(self):
+    def test_from_headers_with_restlet_config(self) -> None:
         """Test creating service with RESTlet configuration from headers."""
-        headers = {
-            "x-netsuite-account": "TEST123",
-            "x-netsuite-email": "test@example.com",
-            "x-netsuite-password": "password",
-            "x-netsuite-script-id": "customscript123",
-            "x-netsuite-deploy-id": "customdeploy1",
-        }
+        headers = {**BASE_PASSWORD_HEADERS, **BASE_RESTLET_HEADERS}
 
         service = NetSuiteAuthService.from_headers(headers)
 
         assert service.config.script_id == "customscript123"
         assert service.config.deploy_id == "customdeploy1"
 
-    def test_from_headers_missing_account(self):
+    def test_from_headers_missing_account(self) -> None:
         """Test from_headers raises error when account is missing."""
-        headers = {
-            "x-netsuite-email": "test@example.com",
-            "x-netsuite-password": "password",
-        }
+        headers = {k: v for k, v in BASE_PASSWORD_HEADERS.items() if k != "x-netsuite-account"}
 
         with pytest.raises(
             AuthenticationError, match="Missing required header: X-NetSuite-Account"
         ):
             NetSuiteAuthService.from_headers(headers)
 
-    def test_from_headers_missing_credentials(self):
+    def test_from_headers_missing_credentials(self) -> None:
         """Test from_headers raises error when credentials are missing."""
-        headers = {
-            "x-netsuite-account": "TEST123",
-        }
+        headers = {"x-netsuite-account": BASE_PASSWORD_HEADERS["x-netsuite-account"]}
 
         with pytest.raises(AuthenticationError, match="Missing authentication credentials"):
             NetSuiteAuthService.from_headers(headers)
 
-    def test_from_headers_incomplete_oauth(self):
+    @pytest.mark.parametrize(
+        "missing",
+        [
+            "x-netsuite-consumer-key",
+            "x-netsuite-consumer-secret",
+            "x-netsuite-token-id",
+            "x-netsuite-token-secret",
+        ],
+    )
+    def test_from_headers_incomplete_oauth(self, missing: str) -> None:
         """Test from_headers raises error when OAuth credentials are incomplete."""
-        headers = {
-            "x-netsuite-account": "TEST123",
-            "x-netsuite-consumer-key": "key",
-            "x-netsuite-consumer-secret": "secret",
-            # Missing token-id and token-secret
-        }
+        headers = {k: v for k, v in BASE_OAUTH_HEADERS.items() if k != missing}
 
         with pytest.raises(AuthenticationError, match="Missing authentication credentials"):
             NetSuiteAuthService.from_headers(headers)
@@ -0,0 +1,24 @@
+"""Tests for NetSuite base classes."""
+
+from app.core.config import NetSuiteConfig
+from app.services.netsuite.base import BaseNetSuiteClient
+
+
+class _ExampleClient(BaseNetSuiteClient):
+    def authenticate(self) -> None:
+        pass
+
+
+class TestBaseNetSuiteClient:
+    """Tests for BaseNetSuiteClient."""
+
+    def test_logger_shared_per_subclass(self):
+        """Test instances of a subclass share one class-level logger."""
+        config = NetSuiteConfig(account="TEST123", email="test@example.com", password="password")
+
+        first = _ExampleClient(config)
+        second = _ExampleClient(config)
+
+        assert first.logger is second.logger
+        assert _ExampleClient.logger is not BaseNetSuiteClient.logger
+        assert "logger" not in vars(first)
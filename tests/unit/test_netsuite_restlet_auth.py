@@ -0,0 +1,84 @@
+"""Tests for NetSuite RESTlet authentication flows."""
+
+import base64
+import hashlib
+import hmac
+from urllib.parse import quote
+
+import httpx
+
+from app.services.netsuite.restlet.auth import NetSuiteOAuth1Auth, NetSuitePasswordAuth
+
+RESTLET_URL = (
+    "https://test123.restlets.api.netsuite.com/app/site/hosting/restlet.nl"
+    "?script=customscript123&deploy=customdeploy1"
+)
+
+
+def _make_oauth_auth() -> NetSuiteOAuth1Auth:
+    return NetSuiteOAuth1Auth(
+        consumer_key="key",
+        consumer_secret="secret",
+        token_id="token",
+        token_secret="tokensecret",
+        realm="TEST123",
+    )
+
+
+class TestNetSuiteOAuth1Auth:
+    """Tests for NetSuiteOAuth1Auth."""
+
+    def test_authorization_header_signature(self):
+        """Test the signature matches the OAuth 1.0a base string."""
+        auth = _make_oauth_auth()
+        request = httpx.Request("GET", RESTLET_URL)
+
+        header = auth.build_authorization_header(request, nonce="abc", timestamp="1700000000")
+
+        params = (
+            "deploy=customdeploy1&oauth_consumer_key=key&oauth_nonce=abc"
+            "&oauth_signature_method=HMAC-SHA256&oauth_timestamp=1700000000"
+            "&oauth_token=token&oauth_version=1.0&script=customscript123"
+        )
+        base_url = "https://test123.restlets.api.netsuite.com/app/site/hosting/restlet.nl"
+        base_string = f"GET&{quote(base_url, safe='')}&{quote(params, safe='')}"
+        expected = base64.b64encode(
+            hmac.new(b"secret&tokensecret", base_string.encode(), hashlib.sha256).digest()
+        ).decode()
+
+        assert header.startswith('OAuth realm="TEST123", ')
+        assert f'oauth_signature="{quote(expected, safe="")}"' in header
+        assert 'oauth_signature_method="HMAC-SHA256"' in header
+
+    def test_auth_flow_sets_header(self):
+        """Test the auth flow signs each request with a fresh nonce."""
+        auth = _make_oauth_auth()
+
+        first = next(auth.auth_flow(httpx.Request("GET", RESTLET_URL)))
+        second = next(auth.auth_flow(httpx.Request("GET", RESTLET_URL)))
+
+        assert first.headers["Authorization"].startswith("OAuth ")
+        assert first.headers["Authorization"] != second.headers["Authorization"]
+
+
+class TestNetSuitePasswordAuth:
+    """Tests for NetSuitePasswordAuth."""
+
+    def test_auth_flow_sets_headers(self):
+        """Test password headers are added to the request."""
+        auth = NetSuitePasswordAuth(
+            account="TEST123", email="test@example.com", password="password", role="3"
+        )
+
+        request = next(auth.auth_flow(httpx.Request("GET", RESTLET_URL)))
+
+        assert request.headers["NS-Email"] == "test@example.com"
+        assert request.headers["NS-Password"] == "password"
+        assert request.headers["NS-Account"] == "TEST123"
+        assert request.headers["NS-Role"] == "3"
+
+    def test_role_is_optional(self):
+        """Test role header is omitted when no role is provided."""
+        auth = NetSuitePasswordAuth(account="TEST123", email="test@example.com", password="pw")
+
+        assert "NS-Role" not in auth.headers
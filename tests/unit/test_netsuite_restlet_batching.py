@@ -0,0 +1,138 @@
+"""Tests for the batching RESTlet client."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.core.config import NetSuiteConfig
+from app.core.exceptions import RESTletError
+from app.services.netsuite.restlet.batching import BatchingRestletClient
+from app.services.netsuite.restlet.client import NetSuiteRestletClient
+
+
+def _make_client(transport: httpx.MockTransport) -> NetSuiteRestletClient:
+    config = NetSuiteConfig(
+        account="TEST123",
+        email="test@example.com",
+        password="password",
+        script_id="customscript123",
+        deploy_id="customdeploy1",
+    )
+    return NetSuiteRestletClient(config, http_client=httpx.AsyncClient(transport=transport))
+
+
+def _echo_transport(bodies: list[dict[str, object]]) -> httpx.MockTransport:
+    """Transport that records request bodies and echoes each item back."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        bodies.append(body)
+        return httpx.Response(200, json=[{"op": body["op"], "item": i} for i in body["items"]])
+
+    return httpx.MockTransport(handler)
+
+
+class TestBatchingRestletClient:
+    """Tests for BatchingRestletClient."""
+
+    async def test_concurrent_calls_are_batched(self):
+        """Test concurrent calls are coalesced into a single POST."""
+        bodies: list[dict[str, object]] = []
+        batcher = BatchingRestletClient(_make_client(_echo_transport(bodies)), max_delay_ms=20)
+
+        results = await asyncio.gather(*(batcher.call("get", i) for i in range(5)))
+        await batcher.close()
+
+        assert results == [{"op": "get", "item": i} for i in range(5)]
+        assert bodies == [{"op": "get", "items": [0, 1, 2, 3, 4]}]
+
+    async def test_max_batch_splits_requests(self):
+        """Test batches never exceed max_batch items."""
+        bodies: list[dict[str, object]] = []
+        batcher = BatchingRestletClient(
+            _make_client(_echo_transport(bodies)), max_batch=2, max_delay_ms=20
+        )
+
+        results = await asyncio.gather(*(batcher.call("get", i) for i in range(5)))
+        await batcher.close()
+
+        assert [r["item"] for r in results] == [0, 1, 2, 3, 4]
+        assert [len(b["items"]) for b in bodies] == [2, 2, 1]  # type: ignore[arg-type]
+
+    async def test_mixed_operations_are_sent_separately(self):
+        """Test each operation in a batch gets its own POST."""
+        bodies: list[dict[str, object]] = []
+        batcher = BatchingRestletClient(_make_client(_echo_transport(bodies)), max_delay_ms=20)
+
+        results = await asyncio.gather(batcher.call("get", 1), batcher.call("delete", 2))
+        await batcher.close()
+
+        assert results == [{"op": "get", "item": 1}, {"op": "delete", "item": 2}]
+        assert bodies == [{"op": "get", "items": [1]}, {"op": "delete", "items": [2]}]
+
+    async def test_invalid_batch_response_fails_all_calls(self):
+        """Test a response with the wrong shape fails every call in the batch."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[{"only": "one"}])
+
+        batcher = BatchingRestletClient(_make_client(httpx.MockTransport(handler)), max_delay_ms=20)
+
+        results = await asyncio.gather(
+            batcher.call("get", 1), batcher.call("get", 2), return_exceptions=True
+        )
+        await batcher.close()
+
+        assert all(isinstance(r, RESTletError) for r in results)
+        assert results[0].error_code == "INVALID_BATCH_RESPONSE"  # type: ignore[union-attr]
+
+    async def test_close_fails_partially_collected_batch(self):
+        """Test closing while a batch is still filling fails its calls instead of hanging."""
+        bodies: list[dict[str, object]] = []
+        batcher = BatchingRestletClient(
+            _make_client(_echo_transport(bodies)), max_batch=10, max_delay_ms=10_000
+        )
+
+        calls = [asyncio.create_task(batcher.call("get", i)) for i in range(2)]
+        await asyncio.sleep(0.01)  # Let the worker take both calls off the queue
+        await batcher.close()
+
+        results = await asyncio.wait_for(asyncio.gather(*calls, return_exceptions=True), 1)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert not bodies
+
+    async def test_close_fails_batch_waiting_for_in_flight_slot(self):
+        """Test closing fails a full batch still waiting for an in-flight slot."""
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            body = json.loads(request.content)
+            return httpx.Response(200, json=body["items"])
+
+        batcher = BatchingRestletClient(
+            _make_client(httpx.MockTransport(handler)), max_batch=1, max_in_flight=1
+        )
+
+        first = asyncio.create_task(batcher.call("get", 1))
+        second = asyncio.create_task(batcher.call("get", 2))
+        await asyncio.sleep(0.01)  # First batch is in flight, second waits for the slot
+        closing = asyncio.create_task(batcher.close())
+        await asyncio.sleep(0)
+        release.set()
+        await closing
+
+        assert await first == 1
+        with pytest.raises(RuntimeError, match="Batching client closed"):
+            await asyncio.wait_for(second, 1)
+
+    def test_invalid_tunables(self):
+        """Test invalid tunables are rejected."""
+        client = _make_client(_echo_transport([]))
+
+        with pytest.raises(ValueError, match="max_batch"):
+            BatchingRestletClient(client, max_batch=0)
+        with pytest.raises(ValueError, match="max_in_flight"):
+            BatchingRestletClient(client, max_in_flight=0)
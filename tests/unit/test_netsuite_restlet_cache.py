@@ -0,0 +1,78 @@
+"""Tests for the RESTlet response cache."""
+
+from unittest.mock import patch
+
+import httpx
+
+from app.services.netsuite.restlet.cache import RestletResponseCache, get_response_cache
+
+
+class TestRestletResponseCache:
+    """Tests for RestletResponseCache."""
+
+    def test_get_miss(self):
+        """Test a missing key returns None."""
+        cache = RestletResponseCache()
+
+        assert cache.get("missing") is None
+
+    def test_set_and_get(self):
+        """Test a cached response is returned before it expires."""
+        cache = RestletResponseCache()
+        response = httpx.Response(200, json={"id": 1})
+
+        cache.set("key", response)
+
+        assert cache.get("key") is response
+
+    def test_entry_expires(self):
+        """Test entries are dropped once their TTL has passed."""
+        cache = RestletResponseCache(default_ttl=10)
+        response = httpx.Response(200, json={"id": 1})
+
+        with patch("app.services.netsuite.restlet.cache.time.monotonic", return_value=100.0):
+            cache.set("key", response)
+        with patch("app.services.netsuite.restlet.cache.time.monotonic", return_value=110.0):
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+
+    def test_zero_ttl_not_stored(self):
+        """Test a non-positive TTL does not cache the response."""
+        cache = RestletResponseCache()
+
+        cache.set("key", httpx.Response(200), ttl=0)
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = RestletResponseCache(maxsize=2)
+        first = httpx.Response(200)
+        second = httpx.Response(200)
+
+        cache.set("first", first)
+        cache.set("second", second)
+        assert cache.get("first") is first
+        cache.set("third", httpx.Response(200))
+
+        assert cache.get("second") is None
+        assert cache.get("first") is first
+
+    def test_invalidate_scope(self):
+        """Test invalidating a scope drops only that scope's entries."""
+        cache = RestletResponseCache()
+        kept = httpx.Response(200)
+
+        cache.set("first", httpx.Response(200), scope="deploy1")
+        cache.set("second", httpx.Response(200), scope="deploy1")
+        cache.set("other", kept, scope="deploy2")
+        cache.invalidate("deploy1")
+
+        assert cache.get("first") is None
+        assert cache.get("second") is None
+        assert cache.get("other") is kept
+
+    def test_shared_cache(self):
+        """Test the default cache is shared across callers."""
+        assert get_response_cache() is get_response_cache()
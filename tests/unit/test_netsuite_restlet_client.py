@@ -2,37 +2,66 @@
 
 # pyright: reportPrivateUsage=false
 
-from unittest.mock import Mock, patch
+from datetime import UTC, datetime
+from decimal import Decimal
 
+import httpx
 import pytest
-import requests
 
 from app.core.config import NetSuiteConfig
 from app.core.exceptions import (
     AuthenticationError,
     NetSuiteError,
+    NetSuiteTimeoutError,
     RESTletError,
 )
+from app.services.netsuite.restlet.auth import NetSuiteOAuth1Auth, NetSuitePasswordAuth
+from app.services.netsuite.restlet.cache import RestletResponseCache
 from app.services.netsuite.restlet.client import NetSuiteRestletClient
 
 
+def _response(status_code: int, content: bytes = b"") -> httpx.Response:
+    """Build a RESTlet HTTP response."""
+    return httpx.Response(status_code, content=content)
+
+
+# RESTlet clients need a script and deployment on top of the shared configs
+_RESTLET_SCRIPT = {"script_id": "customscript123", "deploy_id": "customdeploy1"}
+
+
+@pytest.fixture(scope="module")
+def minimal_cfg() -> NetSuiteConfig:
+    """RESTlet config with no credentials, shared by the module."""
+    return NetSuiteConfig.model_construct(account="TEST123", script_id="script", deploy_id="deploy")
+
+
+@pytest.fixture(scope="module")
+def password_cfg(password_cfg: NetSuiteConfig) -> NetSuiteConfig:
+    """Shared password-authenticated config with a RESTlet script."""
+    return password_cfg.model_copy(update=_RESTLET_SCRIPT)
+
+
+@pytest.fixture(scope="module")
+def oauth_cfg(oauth_cfg: NetSuiteConfig) -> NetSuiteConfig:
+    """Shared OAuth-authenticated config with a RESTlet script."""
+    return oauth_cfg.model_copy(update=_RESTLET_SCRIPT)
+
+
+@pytest.fixture(scope="module")
+def restlet_client(minimal_cfg: NetSuiteConfig) -> NetSuiteRestletClient:
+    """RESTlet client shared by the response-handling tests, which never mutate it."""
+    return NetSuiteRestletClient(minimal_cfg)
+
+
 class TestNetSuiteRestletClient:
     """Tests for NetSuiteRestletClient."""
 
-    def test_init_success(self):
+    def test_init_success(self, password_cfg: NetSuiteConfig) -> None:
         """Test successful client initialization."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            email="test@example.com",
-            password="password",
-            script_id="customscript123",
-            deploy_id="customdeploy1",
-        )
-
-        client = NetSuiteRestletClient(config)
+        client = NetSuiteRestletClient(password_cfg)
 
-        assert client.config == config
-        assert client._session is None
+        assert client.config == password_cfg
+        assert client._auth is None
         assert client.default_timeout == 300
 
     def test_init_missing_script_id(self):
@@ -57,56 +86,62 @@ class TestNetSuiteRestletClient:
                 script_id="customscript123",
             )
 
-    def test_base_url_production(self):
+    def test_base_url_production(self, minimal_cfg: NetSuiteConfig) -> None:
         """Test base URL generation for production account."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            script_id="script",
-            deploy_id="deploy",
-        )
-        client = NetSuiteRestletClient(config)
+        client = NetSuiteRestletClient(minimal_cfg)
 
         assert (
             client.base_url
             == "https://test123.restlets.api.netsuite.com/app/site/hosting/restlet.nl"
         )
 
-    def test_base_url_sandbox(self):
+    @pytest.mark.parametrize(
+        ("account", "expected_host"),
+        [
+            ("TEST123-SB1", "test123-sb1"),
+            ("TEST123-SB2", "test123-sb2"),
+            ("TEST_SB1", "test-sb1"),
+            ("TEST_SB2", "test-sb2"),
+        ],
+    )
+    def test_base_url_sandbox(self, account: str, expected_host: str) -> None:
         """Test base URL generation for sandbox accounts."""
-        for account in ["TEST123-SB1", "TEST123-SB2", "TEST_SB1", "TEST_SB2"]:
-            config = NetSuiteConfig(
-                account=account,
-                script_id="script",
-                deploy_id="deploy",
-            )
-            client = NetSuiteRestletClient(config)
+        config = NetSuiteConfig(account=account, script_id="script", deploy_id="deploy")
+        client = NetSuiteRestletClient(config)
 
-            base_account = account.lower().replace("_", "-")
-            expected = (
-                f"https://{base_account}.restlets.api.netsuite.com/app/site/hosting/restlet.nl"
-            )
-            assert client.base_url == expected
+        assert client.base_url == (
+            f"https://{expected_host}.restlets.api.netsuite.com/app/site/hosting/restlet.nl"
+        )
 
-    def test_build_url(self):
+    def test_build_url(self, password_cfg: NetSuiteConfig) -> None:
         """Test URL building with query parameters."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            script_id="customscript123",
-            deploy_id="customdeploy1",
-        )
-        client = NetSuiteRestletClient(config)
+        client = NetSuiteRestletClient(password_cfg)
 
         url = client._build_url(param1="value1", param2="value2")
 
         expected = "https://test123.restlets.api.netsuite.com/app/site/hosting/restlet.nl?script=customscript123&deploy=customdeploy1&param1=value1&param2=value2"
         assert url == expected
 
-    @patch("requests.Session")
-    def test_create_password_session(self, mock_session_class: Mock):
-        """Test password session creation."""
-        mock_session = Mock()
-        mock_session_class.return_value = mock_session
+    def test_build_url_without_params(self, password_cfg: NetSuiteConfig) -> None:
+        """Test URL building with no extra parameters returns the precomputed URL."""
+        client = NetSuiteRestletClient(password_cfg)
+
+        assert client._build_url() is client._build_url()
+        assert client._build_url() == (
+            "https://test123.restlets.api.netsuite.com/app/site/hosting/restlet.nl"
+            "?script=customscript123&deploy=customdeploy1"
+        )
 
+    def test_build_url_encodes_values(self, password_cfg: NetSuiteConfig) -> None:
+        """Test query parameter values are percent-encoded."""
+        client = NetSuiteRestletClient(password_cfg)
+
+        url = client._build_url(q="a&b c")
+
+        assert url.endswith("&q=a%26b+c")
+
+    def test_create_password_auth(self):
+        """Test password auth creation."""
         config = NetSuiteConfig(
             account="TEST123",
             email="test@example.com",
@@ -117,24 +152,18 @@ class TestNetSuiteRestletClient:
         )
         client = NetSuiteRestletClient(config)
 
-        session = client._create_password_session()
+        auth = client._create_password_auth()
 
-        assert session == mock_session
-        expected_headers = {
+        assert isinstance(auth, NetSuitePasswordAuth)
+        assert auth.headers == {
             "NS-Email": "test@example.com",
             "NS-Password": "password",
             "NS-Account": "TEST123",
             "NS-Role": "3",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "NetSuite-Proxy/1.0",
         }
-        mock_session.headers.update.assert_called_once()
-        actual_headers = mock_session.headers.update.call_args[0][0]
-        assert actual_headers == expected_headers
 
-    def test_create_password_session_missing_email(self):
-        """Test password session creation fails when email is missing."""
+    def test_create_password_auth_missing_email(self):
+        """Test password auth creation fails when email is missing."""
         config = NetSuiteConfig(
             account="TEST123",
             password="password",
@@ -144,43 +173,23 @@ class TestNetSuiteRestletClient:
         client = NetSuiteRestletClient(config)
 
         with pytest.raises(AuthenticationError, match="Email and password required"):
-            client._create_password_session()
+            client._create_password_auth()
 
-    @patch("app.services.netsuite.restlet.client.OAuth1Session")
-    def test_create_oauth_session(self, mock_oauth_class: Mock):
-        """Test OAuth session creation."""
-        mock_session = Mock()
-        mock_oauth_class.return_value = mock_session
+    def test_create_oauth_auth(self, oauth_cfg: NetSuiteConfig) -> None:
+        """Test OAuth auth creation."""
+        client = NetSuiteRestletClient(oauth_cfg)
 
-        config = NetSuiteConfig(
-            account="TEST123",
-            consumer_key="key",
-            consumer_secret="secret",
-            token_id="token",
-            token_secret="tokensecret",
-            script_id="script",
-            deploy_id="deploy",
-        )
-        client = NetSuiteRestletClient(config)
+        auth = client._create_oauth_auth()
 
-        session = client._create_oauth_session()
+        assert isinstance(auth, NetSuiteOAuth1Auth)
+        assert client.auth is not None
 
-        assert session == mock_session
-        mock_oauth_class.assert_called_once_with(
-            client_key="key",
-            client_secret="secret",
-            resource_owner_key="token",
-            resource_owner_secret="tokensecret",
-            signature_method="HMAC-SHA256",
-        )
-        expected_headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "NetSuite-Proxy/1.0",
-        }
-        mock_session.headers.update.assert_called_once_with(expected_headers)
-        # Check that realm was set
-        assert mock_session.auth.realm == "TEST123"
+    def test_auth_unsupported_type(self, minimal_cfg: NetSuiteConfig) -> None:
+        """Test auth creation fails when no credentials are configured."""
+        client = NetSuiteRestletClient(minimal_cfg)
+
+        with pytest.raises(AuthenticationError, match="Unsupported auth type: none"):
+            _ = client.auth
 
     def test_create_oauth_session_missing_credentials(self):
         """Test OAuth session creation fails when credentials are missing."""
@@ -195,186 +204,279 @@ class TestNetSuiteRestletClient:
                 deploy_id="deploy",
             )
 
-    def test_handle_response_success(self):
+    def test_handle_response_success(self, restlet_client: NetSuiteRestletClient) -> None:
         """Test successful response handling."""
+        response = _response(200, b'{"result": "success"}')
+
+        assert restlet_client._handle_response(response) == {"result": "success"}
+
+    @pytest.mark.parametrize(
+        ("status_code", "match"),
+        [
+            pytest.param(401, "RESTlet authentication failed", id="401"),
+            pytest.param(403, "Insufficient permissions", id="403"),
+        ],
+    )
+    def test_handle_response_auth_errors(
+        self, restlet_client: NetSuiteRestletClient, status_code: int, match: str
+    ) -> None:
+        """Test 401 and 403 responses raise AuthenticationError."""
+        with pytest.raises(AuthenticationError, match=match):
+            restlet_client._handle_response(_response(status_code))
+
+    @pytest.mark.parametrize(
+        ("status_code", "content", "expected"),
+        [
+            pytest.param(
+                400,
+                b'{"error": {"message": "Invalid parameters"}}',
+                ("400", "Invalid parameters"),
+                id="error-with-json",
+            ),
+            pytest.param(
+                500,
+                b"Internal Server Error",
+                ("500", "Internal Server Error"),
+                id="error-without-json",
+            ),
+            pytest.param(200, b"not json", ("INVALID_JSON", None), id="invalid-json"),
+            pytest.param(
+                200,
+                b'{"error": {"code": "INVALID_RECORD", "message": "Record not found"}}',
+                ("INVALID_RECORD", "Record not found"),
+                id="error-in-data",
+            ),
+        ],
+    )
+    def test_handle_response_restlet_errors(
+        self,
+        restlet_client: NetSuiteRestletClient,
+        status_code: int,
+        content: bytes,
+        expected: tuple[str, str | None],
+    ) -> None:
+        """Test error responses raise RESTletError with the code and message."""
+        error_code, message = expected
+
+        with pytest.raises(RESTletError) as exc_info:
+            restlet_client._handle_response(_response(status_code, content))
+
+        error = exc_info.value
+        assert error.error_code == error_code
+        if message is not None:
+            assert error.error_details["message"] == message
+
+    @pytest.mark.parametrize(
+        ("error", "expected_exc", "match"),
+        [
+            pytest.param(
+                httpx.ConnectError("Connection refused"),
+                NetSuiteError,
+                "Failed to connect to NetSuite",
+                id="connection",
+            ),
+            pytest.param(
+                httpx.RequestError("Request failed"),
+                NetSuiteError,
+                "RESTlet request failed",
+                id="generic-request",
+            ),
+            pytest.param(
+                ValueError("Some other error"), ValueError, "Some other error", id="other"
+            ),
+        ],
+    )
+    def test_handle_request_error(
+        self,
+        restlet_client: NetSuiteRestletClient,
+        error: Exception,
+        expected_exc: type[Exception],
+        match: str,
+    ) -> None:
+        """Test request errors are converted, and other errors re-raised."""
+        with pytest.raises(expected_exc, match=match):
+            restlet_client._handle_request_error(error)
+
+
+class TestNetSuiteRestletClientRequests:
+    """Tests for RESTlet HTTP requests using an in-memory transport."""
+
+    @staticmethod
+    def _make_client(
+        transport: httpx.MockTransport,
+        response_cache: RestletResponseCache | None = None,
+        password: str = "password",
+    ) -> NetSuiteRestletClient:
         config = NetSuiteConfig(
             account="TEST123",
-            script_id="script",
-            deploy_id="deploy",
+            email="test@example.com",
+            password=password,
+            script_id="customscript123",
+            deploy_id="customdeploy1",
         )
-        client = NetSuiteRestletClient(config)
+        return NetSuiteRestletClient(
+            config,
+            http_client=httpx.AsyncClient(transport=transport),
+            response_cache=response_cache if response_cache is not None else RestletResponseCache(),
+        )
+
+    async def test_get_sends_auth_headers(self):
+        """Test GET request is authenticated and parsed."""
+        requests: list[httpx.Request] = []
 
-        response = Mock()
-        response.status_code = 200
-        response.json.return_value = {"result": "success"}
-        response.content = b'{"result": "success"}'
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"result": "success"})
 
-        result = client._handle_response(response)
+        client = self._make_client(httpx.MockTransport(handler))
+
+        result = await client.get(params={"id": "1"})
 
         assert result == {"result": "success"}
+        assert requests[0].method == "GET"
+        assert requests[0].url.params["script"] == "customscript123"
+        assert requests[0].url.params["id"] == "1"
+        assert requests[0].headers["NS-Email"] == "test@example.com"
 
-    def test_handle_response_401(self):
-        """Test handling 401 authentication error."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            script_id="script",
-            deploy_id="deploy",
-        )
-        client = NetSuiteRestletClient(config)
+    async def test_get_served_from_cache(self):
+        """Test repeated GETs for the same URL are served from the cache."""
+        requests: list[httpx.Request] = []
 
-        response = Mock()
-        response.status_code = 401
-        response.content = b""
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"result": "success"})
 
-        with pytest.raises(AuthenticationError, match="RESTlet authentication failed"):
-            client._handle_response(response)
+        client = self._make_client(httpx.MockTransport(handler))
 
-    def test_handle_response_403(self):
-        """Test handling 403 permission error."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            script_id="script",
-            deploy_id="deploy",
-        )
-        client = NetSuiteRestletClient(config)
+        first = await client.get(params={"id": "1"})
+        first["result"] = "mutated"
+        second = await client.get(params={"id": "1"})
 
-        response = Mock()
-        response.status_code = 403
-        response.content = b""
+        assert second == {"result": "success"}
+        assert len(requests) == 1
 
-        with pytest.raises(AuthenticationError, match="Insufficient permissions"):
-            client._handle_response(response)
+    async def test_get_cache_misses_for_wrong_credentials(self):
+        """Test a known email with the wrong password is not served a cached response."""
+        passwords: list[str] = []
 
-    def test_handle_response_error_with_json(self):
-        """Test handling error response with JSON error message."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            script_id="script",
-            deploy_id="deploy",
-        )
-        client = NetSuiteRestletClient(config)
+        def handler(request: httpx.Request) -> httpx.Response:
+            passwords.append(request.headers["NS-Password"])
+            if request.headers["NS-Password"] != "password":
+                return httpx.Response(401)
+            return httpx.Response(200, json={"secret": "data"})
 
-        response = Mock()
-        response.status_code = 400
-        response.json.return_value = {"error": {"message": "Invalid parameters"}}
-        response.text = '{"error": {"message": "Invalid parameters"}}'
-        response.content = response.text.encode()
+        transport = httpx.MockTransport(handler)
+        cache = RestletResponseCache()
+        await self._make_client(transport, cache).get(params={"id": "1"})
+        intruder = self._make_client(transport, cache, password="wrong-password")
 
-        with pytest.raises(RESTletError) as exc_info:
-            client._handle_response(response)
+        with pytest.raises(AuthenticationError):
+            await intruder.get(params={"id": "1"})
 
-        error = exc_info.value
-        assert error.error_code == "400"
-        assert error.error_details is not None
-        assert error.error_details["message"] == "Invalid parameters"
+        assert passwords == ["password", "wrong-password"]
 
-    def test_handle_response_error_without_json(self):
-        """Test handling error response without JSON."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            script_id="script",
-            deploy_id="deploy",
-        )
-        client = NetSuiteRestletClient(config)
+    @pytest.mark.parametrize("method", ["post", "put", "delete"])
+    async def test_writes_invalidate_cached_gets(self, method: str) -> None:
+        """Test a write drops cached reads for the deployment, for every caller."""
+        requests: list[httpx.Request] = []
 
-        response = Mock()
-        response.status_code = 500
-        response.json.side_effect = ValueError()
-        response.text = "Internal Server Error"
-        response.content = response.text.encode()
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"result": len(requests)})
 
-        with pytest.raises(RESTletError) as exc_info:
-            client._handle_response(response)
+        transport = httpx.MockTransport(handler)
+        cache = RestletResponseCache()
+        reader = self._make_client(transport, cache)
+        writer = self._make_client(transport, cache)
 
-        error = exc_info.value
-        assert error.error_code == "500"
-        assert error.error_details is not None
-        assert error.error_details["message"] == "Internal Server Error"
+        assert await reader.get(params={"id": "1"}) == {"result": 1}
+        await getattr(writer, method)()
 
-    def test_handle_response_invalid_json(self):
-        """Test handling response with invalid JSON."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            script_id="script",
-            deploy_id="deploy",
-        )
-        client = NetSuiteRestletClient(config)
+        assert await reader.get(params={"id": "1"}) == {"result": 3}
+        assert len(cache) == 1
 
-        response = Mock()
-        response.status_code = 200
-        response.json.side_effect = ValueError("Invalid JSON")
-        response.content = b"not json"
+    async def test_get_cache_bypass(self):
+        """Test a zero cache TTL always goes to the network."""
+        requests: list[httpx.Request] = []
 
-        with pytest.raises(RESTletError) as exc_info:
-            client._handle_response(response)
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"result": "success"})
 
-        assert exc_info.value.error_code == "INVALID_JSON"
+        client = self._make_client(httpx.MockTransport(handler))
 
-    def test_handle_response_with_error_in_data(self):
-        """Test handling successful response with error in data."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            script_id="script",
-            deploy_id="deploy",
-        )
-        client = NetSuiteRestletClient(config)
+        await client.get(params={"id": "1"}, cache_ttl=0)
+        await client.get(params={"id": "1"}, cache_ttl=0)
 
-        response = Mock()
-        response.status_code = 200
-        response.json.return_value = {
-            "error": {
-                "code": "INVALID_RECORD",
-                "message": "Record not found",
-            }
-        }
-        response.content = b'{"error": {"code": "INVALID_RECORD", "message": "Record not found"}}'
+        assert len(requests) == 2
 
-        with pytest.raises(RESTletError) as exc_info:
-            client._handle_response(response)
+    async def test_get_errors_not_cached(self):
+        """Test failed GETs are not cached."""
+        requests: list[httpx.Request] = []
 
-        error = exc_info.value
-        assert error.error_code == "INVALID_RECORD"
-        assert error.error_details is not None
-        assert error.error_details["message"] == "Record not found"
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(500, text="Internal Server Error")
 
-    def test_handle_request_error_connection(self):
-        """Test handling connection errors."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            script_id="script",
-            deploy_id="deploy",
-        )
-        client = NetSuiteRestletClient(config)
+        client = self._make_client(httpx.MockTransport(handler))
 
-        error = requests.exceptions.ConnectionError("Connection refused")
+        for _ in range(2):
+            with pytest.raises(RESTletError):
+                await client.get()
 
-        with pytest.raises(NetSuiteError, match="Failed to connect to NetSuite"):
-            client._handle_request_error(error)
+        assert len(requests) == 2
 
-    def test_handle_request_error_generic_request(self):
-        """Test handling generic request errors."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            script_id="script",
-            deploy_id="deploy",
-        )
-        client = NetSuiteRestletClient(config)
+    async def test_post_sends_json_body(self):
+        """Test POST request sends JSON body."""
+        requests: list[httpx.Request] = []
 
-        error = requests.exceptions.RequestException("Request failed")
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"id": 42})
 
-        with pytest.raises(NetSuiteError, match="RESTlet request failed"):
-            client._handle_request_error(error)
+        client = self._make_client(httpx.MockTransport(handler))
 
-    def test_handle_request_error_other(self):
-        """Test handling non-request errors."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            script_id="script",
-            deploy_id="deploy",
+        result = await client.post(data={"name": "Test"})
+
+        assert result == {"id": 42}
+        assert requests[0].method == "POST"
+        assert requests[0].content == b'{"name":"Test"}'
+
+    async def test_put_encodes_dates_and_decimals(self):
+        """Test PUT bodies serialize datetimes and decimals."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"id": 42})
+
+        client = self._make_client(httpx.MockTransport(handler))
+
+        await client.put(
+            data={"date": datetime(2024, 1, 15, 10, 30, tzinfo=UTC), "amount": Decimal("1.10")}
         )
-        client = NetSuiteRestletClient(config)
 
-        error = ValueError("Some other error")
+        assert requests[0].content == b'{"date":"2024-01-15T10:30:00+00:00","amount":"1.10"}'
+        assert requests[0].headers["Content-Type"] == "application/json"
 
-        with pytest.raises(ValueError, match="Some other error"):
-            client._handle_request_error(error)
+    async def test_get_timeout(self):
+        """Test timeouts are converted to NetSuiteTimeoutError."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = self._make_client(httpx.MockTransport(handler))
+
+        with pytest.raises(NetSuiteTimeoutError, match="RESTlet GET"):
+            await client.get()
+
+    async def test_connection_error(self):
+        """Test connection errors are converted to NetSuiteError."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        client = self._make_client(httpx.MockTransport(handler))
+
+        with pytest.raises(NetSuiteError, match="Failed to connect to NetSuite"):
+            await client.delete()
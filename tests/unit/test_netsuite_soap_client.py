@@ -2,40 +2,107 @@
 
 # pyright: reportPrivateUsage=false
 
+import base64
+import hashlib
+import hmac
+import subprocess
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass
 from unittest.mock import Mock, patch
+from xml.etree import ElementTree
 
 import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from zeep.exceptions import Fault, TransportError
 
 from app.core.config import NetSuiteConfig
+from app.core.constants import NETSUITE_SOAP_POOL_MAXSIZE
 from app.core.exceptions import (
     AuthenticationError,
     NetSuiteError,
     NetSuiteTimeoutError,
     SOAPFaultError,
 )
-from app.services.netsuite.soap.client import NetSuiteSoapClient
+from app.services.netsuite.soap.client import (
+    NetSuiteSoapClient,
+    _NoncePool,
+    get_soap_session,
+    get_ssl_context,
+    get_zeep_client,
+)
+
+
+@dataclass(frozen=True)
+class _FaultStub:
+    """SOAP fault detail with the attributes _handle_soap_error reads."""
+
+    faultcode: str
+    faultstring: str
+
+
+class _FaultAttributeError(Exception):
+    """Error exposing its SOAP fault as an attribute rather than being a zeep Fault."""
+
+    def __init__(self, fault: _FaultStub) -> None:
+        super().__init__("SOAP request failed")
+        self.fault = fault
+
+
+_PLATFORM_FAULTS_NS = "urn:faults_2024_2.platform.webservices.netsuite.com"
+
+
+def _user_exception(platform_code: str, message: str) -> Fault:
+    """Build a fault shaped like NetSuite's, with the specific code in its detail."""
+    detail = ElementTree.fromstring(
+        f'<detail xmlns:platformFaults="{_PLATFORM_FAULTS_NS}">'
+        "<platformFaults:invalidCredentialsFault>"
+        f"<platformFaults:code>{platform_code}</platformFaults:code>"
+        f"<platformFaults:message>{message}</platformFaults:message>"
+        "</platformFaults:invalidCredentialsFault>"
+        "</detail>"
+    )
+    return Fault(message, code="soapenv:Server.userException", detail=detail)
+
+
+# Built like the shared password_cfg and oauth_cfg fixtures in conftest.py
+@pytest.fixture(scope="module")
+def minimal_cfg() -> NetSuiteConfig:
+    """Config with no credentials, shared by the module."""
+    return NetSuiteConfig.model_construct(account="TEST123")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patched_zeep_client() -> Iterator[Mock]:
+    """Patch ``zeep.Client`` so no test can start a real WSDL fetch and parse."""
+    with patch("zeep.Client") as zeep_client:
+        yield zeep_client
+    get_zeep_client.cache_clear()
+
+
+@pytest.fixture
+def mock_zeep_client(patched_zeep_client: Mock) -> Mock:
+    """The patched ``zeep.Client``, reset along with the shared client cache."""
+    patched_zeep_client.reset_mock(return_value=True, side_effect=True)
+    get_zeep_client.cache_clear()
+    return patched_zeep_client
 
 
 class TestNetSuiteSoapClient:
     """Tests for NetSuiteSoapClient."""
 
-    def test_init(self):
+    def test_init(self, password_cfg: NetSuiteConfig) -> None:
         """Test client initialization."""
-        config = NetSuiteConfig(
-            account="TEST123",
-            email="test@example.com",
-            password="password",
-        )
 
-        client = NetSuiteSoapClient(config)
+        client = NetSuiteSoapClient(password_cfg)
 
-        assert client.config == config
+        assert client.config == password_cfg
         assert client._client is None
         assert client._service is None
         assert client.settings.xml_huge_tree is True
         assert client.settings.strict is False
-        # Transport timeout is set via constructor, not attribute
-        assert client.transport is not None
+        assert client.timeout == 1200
 
     def test_wsdl_url_generation(self):
         """Test WSDL URL generation."""
@@ -76,6 +143,22 @@ class TestNetSuiteSoapClient:
             "role": {"internalId": "3"},
         }
 
+    def test_create_passport_password_auth_cached(self, password_cfg: NetSuiteConfig) -> None:
+        """Test the static password passport is built once and reused."""
+        client = NetSuiteSoapClient(password_cfg)
+
+        assert client._create_passport() is client._create_passport()
+
+    def test_create_passport_oauth_auth_fresh_per_call(self, oauth_cfg: NetSuiteConfig) -> None:
+        """Test OAuth passports get fresh nonces without touching the cached template."""
+        client = NetSuiteSoapClient(oauth_cfg)
+
+        first = client._create_passport()
+        second = client._create_passport()
+
+        assert first["nonce"] != second["nonce"]
+        assert "nonce" not in client._passport_template
+
     def test_create_passport_password_auth_missing_credentials(self):
         """Test passport creation fails when password credentials are missing."""
         config = NetSuiteConfig(
@@ -89,25 +172,12 @@ class TestNetSuiteSoapClient:
         with pytest.raises(AuthenticationError, match="Unsupported auth type: none"):
             client._create_passport()
 
-    @patch("app.services.netsuite.soap.client.NetSuiteSoapClient._generate_nonce")
-    @patch("app.services.netsuite.soap.client.NetSuiteSoapClient._get_timestamp")
-    @patch("app.services.netsuite.soap.client.NetSuiteSoapClient._generate_signature")
-    def test_create_passport_oauth_auth(
-        self, mock_signature: Mock, mock_timestamp: Mock, mock_nonce: Mock
-    ):
+    def test_create_passport_oauth_auth(self, oauth_cfg: NetSuiteConfig) -> None:
         """Test passport creation for OAuth authentication."""
-        mock_nonce.return_value = "test-nonce"
-        mock_timestamp.return_value = "1234567890"
-        mock_signature.return_value = "test-signature"
-
-        config = NetSuiteConfig(
-            account="TEST123",
-            consumer_key="key",
-            consumer_secret="secret",
-            token_id="token",
-            token_secret="tokensecret",
-        )
-        client = NetSuiteSoapClient(config)
+        client = NetSuiteSoapClient(oauth_cfg)
+        client._generate_nonce = Mock(return_value="test-nonce")
+        client._get_timestamp = Mock(return_value="1234567890")
+        client._generate_signature = mock_signature = Mock(return_value="test-signature")
 
         passport = client._create_passport()
 
@@ -122,6 +192,22 @@ class TestNetSuiteSoapClient:
                 "value": "test-signature",
             },
         }
+        mock_signature.assert_called_once_with("test-nonce", "1234567890")
+
+    def test_generate_signature(self, oauth_cfg: NetSuiteConfig) -> None:
+        """Test the signature covers the given nonce and timestamp."""
+        client = NetSuiteSoapClient(oauth_cfg)
+
+        expected = base64.b64encode(
+            hmac.new(
+                b"secret&tokensecret",
+                b"TEST123&key&token&test-nonce&1234567890",
+                hashlib.sha256,
+            ).digest()
+        ).decode()
+
+        assert client._generate_signature("test-nonce", "1234567890") == expected
+        assert client._generate_signature("test-nonce", "1234567890") == expected
 
     def test_create_passport_oauth_auth_missing_credentials(self):
         """Test passport creation fails when OAuth credentials are missing."""
@@ -134,43 +220,18 @@ class TestNetSuiteSoapClient:
                 # Missing token_id and token_secret
             )
 
-    def test_create_passport_no_auth(self):
+    def test_create_passport_no_auth(self, minimal_cfg: NetSuiteConfig) -> None:
         """Test passport creation fails when no auth is configured."""
-        config = NetSuiteConfig(account="TEST123")
-        client = NetSuiteSoapClient(config)
+        client = NetSuiteSoapClient(minimal_cfg)
 
         with pytest.raises(AuthenticationError, match="Unsupported auth type: none"):
             client._create_passport()
 
-    def test_handle_soap_error_timeout(self):
-        """Test handling timeout errors."""
-        config = NetSuiteConfig(account="TEST123")
-        client = NetSuiteSoapClient(config)
-
-        error = Exception("Connection timeout occurred")
-
-        with pytest.raises(NetSuiteTimeoutError):
-            client._handle_soap_error(error)
-
-    def test_handle_soap_error_authentication(self):
-        """Test handling authentication errors."""
-        config = NetSuiteConfig(account="TEST123")
-        client = NetSuiteSoapClient(config)
-
-        error = Exception("Invalid login attempt")
-
-        with pytest.raises(AuthenticationError, match="NetSuite authentication failed"):
-            client._handle_soap_error(error)
-
-    def test_handle_soap_error_fault(self):
+    def test_handle_soap_error_fault(self, minimal_cfg: NetSuiteConfig) -> None:
         """Test handling SOAP fault errors."""
-        config = NetSuiteConfig(account="TEST123")
-        client = NetSuiteSoapClient(config)
+        client = NetSuiteSoapClient(minimal_cfg)
 
-        error = Mock()
-        error.fault = Mock()
-        error.fault.faultcode = "INVALID_REQUEST"
-        error.fault.faultstring = "Invalid request format"
+        error = _FaultAttributeError(_FaultStub("INVALID_REQUEST", "Invalid request format"))
 
         with pytest.raises(SOAPFaultError) as exc_info:
             client._handle_soap_error(error)
@@ -179,23 +240,184 @@ class TestNetSuiteSoapClient:
         assert exc_info.value.fault_string == "Invalid request format"
         assert str(exc_info.value) == "SOAP Fault: INVALID_REQUEST - Invalid request format"
 
-    def test_handle_soap_error_generic(self):
-        """Test handling generic errors."""
-        config = NetSuiteConfig(account="TEST123")
-        client = NetSuiteSoapClient(config)
+    def test_handle_soap_error_zeep_fault(self, minimal_cfg: NetSuiteConfig) -> None:
+        """Test zeep faults map to SOAPFaultError using their code and message."""
+        client = NetSuiteSoapClient(minimal_cfg)
+
+        with pytest.raises(SOAPFaultError) as exc_info:
+            client._handle_soap_error(Fault("Record not found", code="RCRD_DSNT_EXIST"))
+
+        assert exc_info.value.fault_code == "RCRD_DSNT_EXIST"
+        assert exc_info.value.fault_string == "Record not found"
 
-        error = Exception("Something went wrong")
+    def test_handle_soap_error_user_exception_code(self, minimal_cfg: NetSuiteConfig) -> None:
+        """Test user exceptions report the platform fault code from their detail."""
+        client = NetSuiteSoapClient(minimal_cfg)
 
-        with pytest.raises(NetSuiteError, match="NetSuite SOAP error: Something went wrong"):
+        with pytest.raises(SOAPFaultError) as exc_info:
+            client._handle_soap_error(_user_exception("RCRD_DSNT_EXIST", "Record not found"))
+
+        assert exc_info.value.fault_code == "RCRD_DSNT_EXIST"
+        assert exc_info.value.fault_string == "Record not found"
+
+    @pytest.mark.parametrize(
+        ("error", "expected_exc", "match"),
+        [
+            pytest.param(
+                Exception("Connection timeout occurred"),
+                NetSuiteTimeoutError,
+                None,
+                id="timeout-message",
+            ),
+            pytest.param(
+                requests.exceptions.ReadTimeout("read failed"),
+                NetSuiteTimeoutError,
+                None,
+                id="requests-timeout",
+            ),
+            pytest.param(
+                Exception("Invalid login attempt"),
+                AuthenticationError,
+                "NetSuite authentication failed",
+                id="authentication-message",
+            ),
+            pytest.param(
+                _user_exception(
+                    "INVALID_LOGIN_CREDENTIALS",
+                    "You have entered an invalid email address or account number.",
+                ),
+                AuthenticationError,
+                "NetSuite authentication failed",
+                id="user-exception-auth-code",
+            ),
+            pytest.param(
+                _user_exception("INVALID_LOGIN_ATTEMPT", "Invalid login attempt."),
+                AuthenticationError,
+                "NetSuite authentication failed",
+                id="user-exception-invalid-login",
+            ),
+            pytest.param(
+                TransportError(status_code=401),
+                AuthenticationError,
+                None,
+                id="transport-unauthorized",
+            ),
+            pytest.param(
+                Exception("Something went wrong"),
+                NetSuiteError,
+                "NetSuite SOAP error: Something went wrong",
+                id="generic",
+            ),
+        ],
+    )
+    def test_handle_soap_error(
+        self,
+        minimal_cfg: NetSuiteConfig,
+        error: Exception,
+        expected_exc: type[NetSuiteError],
+        match: str | None,
+    ) -> None:
+        """Test each error kind maps to the matching NetSuite exception."""
+        client = NetSuiteSoapClient(minimal_cfg)
+
+        with pytest.raises(expected_exc, match=match):
             client._handle_soap_error(error)
 
-    @patch("zeep.Client")
-    def test_client_creation_error(self, mock_zeep_client: Mock):
+    def test_client_creation_error(
+        self, mock_zeep_client: Mock, minimal_cfg: NetSuiteConfig
+    ) -> None:
         """Test error handling during client creation."""
         mock_zeep_client.side_effect = Exception("Failed to parse WSDL")
 
-        config = NetSuiteConfig(account="TEST123")
-        client = NetSuiteSoapClient(config)
+        client = NetSuiteSoapClient(minimal_cfg)
 
         with pytest.raises(NetSuiteError, match="Failed to initialize SOAP client"):
             _ = client.client
+
+    def test_zeep_client_shared_between_instances(
+        self, mock_zeep_client: Mock, minimal_cfg: NetSuiteConfig
+    ) -> None:
+        """Test the parsed WSDL client is shared by SOAP clients."""
+        first = NetSuiteSoapClient(minimal_cfg)
+        second = NetSuiteSoapClient(NetSuiteConfig(account="OTHER456"))
+
+        assert first.client is second.client
+        mock_zeep_client.assert_called_once()
+
+    def test_zeep_imported_on_first_use(self):
+        """Test importing the SOAP client does not import zeep."""
+        code = (
+            "import sys\n"
+            "import app.services.netsuite.soap.client\n"
+            "assert 'zeep' not in sys.modules\n"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, check=False)
+
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_soap_session_is_shared_and_pooled(self):
+        """Test SOAP transports share one pooled HTTP session."""
+        session = get_soap_session()
+
+        assert get_soap_session() is session
+        adapter = session.get_adapter("https://webservices.netsuite.com")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_maxsize == NETSUITE_SOAP_POOL_MAXSIZE
+        assert adapter.poolmanager.connection_pool_kw["ssl_context"] is get_ssl_context()
+
+    def test_soap_headers_include_passport(self):
+        """Test per-call SOAP headers carry authentication and extras."""
+        config = NetSuiteConfig(
+            account="TEST123",
+            email="test@example.com",
+            password="password",
+            application_id="APP-ID",
+        )
+        client = NetSuiteSoapClient(config)
+
+        headers = client._soap_headers(searchPreferences={"pageSize": 10})
+
+        assert headers == {
+            "passport": {
+                "account": "TEST123",
+                "email": "test@example.com",
+                "password": "password",
+            },
+            "applicationInfo": {"applicationId": "APP-ID"},
+            "searchPreferences": {"pageSize": 10},
+        }
+
+
+class TestNoncePool:
+    """Tests for the buffered OAuth nonce generator."""
+
+    def test_nonces_are_unique_across_refills(self):
+        """Test nonces stay unique when the buffer is refilled."""
+        pool = _NoncePool(nonce_bytes=32, pool_size=96)
+
+        nonces = [pool.take() for _ in range(10)]
+
+        assert len(set(nonces)) == 10
+        assert all(len(nonce) == 43 for nonce in nonces)
+
+    def test_reset_discards_buffer(self):
+        """Test reset forces the next nonce to come from fresh random bytes."""
+        pool = _NoncePool(nonce_bytes=4, pool_size=8)
+
+        with patch("os.urandom", side_effect=[b"\x00" * 8, b"\xff" * 8]) as mock_urandom:
+            pool.take()
+            pool.reset()
+            nonce = pool.take()
+
+        assert nonce == "_____w"
+        assert mock_urandom.call_count == 2
+
+    def test_reset_replaces_held_lock(self):
+        """Test reset recovers from a lock held at fork time in the parent."""
+        pool = _NoncePool(nonce_bytes=4, pool_size=8)
+        pool._lock.acquire()
+
+        pool.reset()
+
+        assert pool._lock.acquire(blocking=False)
@@ -13,6 +13,10 @@ from app.models.query_params import (
     TransactionQueryParams,
 )
 
+# Date-range bounds shared by the date filtering tests
+_JAN1 = datetime(2024, 1, 1, tzinfo=UTC)
+_DEC31 = datetime(2024, 12, 31, tzinfo=UTC)
+
 
 class TestPaginationParams:
     """Tests for pagination-related parameters in BaseQueryParams."""
@@ -75,44 +79,31 @@ class TestDateRangeParams:
 
     def test_valid_date_ranges(self):
         """Test valid date ranges."""
-        created_since = datetime(2024, 1, 1, tzinfo=UTC)
-        created_before = datetime(2024, 12, 31, tzinfo=UTC)
-        params = BaseQueryParams(
-            created_since=created_since,
-            created_before=created_before,
-        )
-        assert params.created_since == created_since
-        assert params.created_before == created_before
+        params = BaseQueryParams(created_since=_JAN1, created_before=_DEC31)
+        assert params.created_since == _JAN1
+        assert params.created_before == _DEC31
 
     def test_invalid_created_date_range(self):
         """Test invalid created date range."""
-        with pytest.raises(ValidationError) as exc_info:
-            BaseQueryParams(
-                created_since=datetime(2024, 12, 31, tzinfo=UTC),
-                created_before=datetime(2024, 1, 1, tzinfo=UTC),
-            )
-        assert "created_since must be before created_before" in str(exc_info.value)
+        with pytest.raises(ValidationError, match="created_since must be before created_before"):
+            BaseQueryParams(created_since=_DEC31, created_before=_JAN1)
 
     def test_invalid_updated_date_range(self):
         """Test invalid updated date range."""
-        with pytest.raises(ValidationError) as exc_info:
-            BaseQueryParams(
-                updated_since=datetime(2024, 12, 31, tzinfo=UTC),
-                updated_before=datetime(2024, 1, 1, tzinfo=UTC),
-            )
-        assert "updated_since must be before updated_before" in str(exc_info.value)
+        with pytest.raises(ValidationError, match="updated_since must be before updated_before"):
+            BaseQueryParams(updated_since=_DEC31, updated_before=_JAN1)
 
     def test_partial_date_ranges(self):
         """Test partial date ranges."""
         # Only since
-        params = BaseQueryParams(created_since=datetime(2024, 1, 1, tzinfo=UTC))
-        assert params.created_since == datetime(2024, 1, 1, tzinfo=UTC)
+        params = BaseQueryParams(created_since=_JAN1)
+        assert params.created_since == _JAN1
         assert params.created_before is None
 
         # Only before
-        params = BaseQueryParams(updated_before=datetime(2024, 12, 31, tzinfo=UTC))
+        params = BaseQueryParams(updated_before=_DEC31)
         assert params.updated_since is None
-        assert params.updated_before == datetime(2024, 12, 31, tzinfo=UTC)
+        assert params.updated_before == _DEC31
 
     def test_timezone_aware_datetime_required(self):
         """Test that naive datetimes are rejected."""
@@ -145,27 +136,24 @@ class TestFieldSelection:
         assert params.body_fields_only is False
         assert params.field_list is None
 
-    def test_single_field(self):
-        """Test single field selection."""
-        params = BaseQueryParams(fields="id")
-        assert params.fields == "id"
-        assert params.field_list == ["id"]
-
-    def test_multiple_fields(self):
-        """Test multiple field selection."""
-        params = BaseQueryParams(fields="id,name,email")
-        assert params.fields == "id,name,email"
-        assert params.field_list == ["id", "name", "email"]
-
-    def test_fields_with_spaces(self):
-        """Test field parsing with spaces."""
-        params = BaseQueryParams(fields="id, name , email")
-        assert params.field_list == ["id", "name", "email"]
-
-    def test_nested_fields(self):
-        """Test nested field selection."""
-        params = BaseQueryParams(fields="id,subsidiary.name,address.city")
-        assert params.field_list == ["id", "subsidiary.name", "address.city"]
+    @pytest.mark.parametrize(
+        ("fields", "expected"),
+        [
+            pytest.param("id", ["id"], id="single"),
+            pytest.param("id,name,email", ["id", "name", "email"], id="multiple"),
+            pytest.param("id, name , email", ["id", "name", "email"], id="with-spaces"),
+            pytest.param(
+                "id,subsidiary.name,address.city",
+                ["id", "subsidiary.name", "address.city"],
+                id="nested",
+            ),
+        ],
+    )
+    def test_field_parsing(self, fields: str, expected: list[str]) -> None:
+        """Test field selection strings are split into field lists."""
+        params = BaseQueryParams(fields=fields)
+        assert params.fields == fields
+        assert params.field_list == expected
 
     def test_body_fields_only(self):
         """Test body fields only flag."""
@@ -190,49 +178,29 @@ class TestIdFiltering:
         assert params.ids is None
         assert params.id_list is None
 
-    def test_single_id(self):
-        """Test single ID."""
-        params = BaseQueryParams(ids="123")
-        assert params.ids == "123"
-        assert params.id_list == [123]
-
-    def test_comma_separated_ids(self):
-        """Test comma-separated IDs."""
-        params = BaseQueryParams(ids="1,2,3")
-        assert params.id_list == [1, 2, 3]
-
-    def test_id_range(self):
-        """Test ID range."""
-        params = BaseQueryParams(ids="1-5")
-        assert params.id_list == [1, 2, 3, 4, 5]
-
-    def test_mixed_ids(self):
-        """Test mixed ID formats."""
-        params = BaseQueryParams(ids="1,5-7,10")
-        assert params.id_list == [1, 5, 6, 7, 10]
-
-    def test_array_format(self):
-        """Test array format IDs."""
-        params = BaseQueryParams(ids="[1,2,3]")
-        assert params.id_list == [1, 2, 3]
-
-    def test_invalid_ids(self):
-        """Test invalid ID formats."""
-        params = BaseQueryParams(ids="abc,def")
-        assert params.id_list is None
-
-    def test_partial_invalid_ids(self):
-        """Test partial invalid IDs."""
-        params = BaseQueryParams(ids="1,abc,3")
-        assert params.id_list == [1, 3]
+    @pytest.mark.parametrize(
+        ("ids", "expected"),
+        [
+            pytest.param("123", [123], id="single"),
+            pytest.param("1,2,3", [1, 2, 3], id="comma-separated"),
+            pytest.param("1-5", [1, 2, 3, 4, 5], id="range"),
+            pytest.param("1,5-7,10", [1, 5, 6, 7, 10], id="mixed"),
+            pytest.param("[1,2,3]", [1, 2, 3], id="array"),
+            pytest.param("abc,def", None, id="invalid"),
+            pytest.param("1,abc,3", [1, 3], id="partial-invalid"),
+        ],
+    )
+    def test_id_parsing(self, ids: str, expected: list[int] | None) -> None:
+        """Test ID filter strings are parsed into ID lists."""
+        params = BaseQueryParams(ids=ids)
+        assert params.ids == ids
+        assert params.id_list == expected
 
     def test_large_range_validation(self):
         """Test that large ID ranges are rejected."""
         params = BaseQueryParams(ids="1-10001")  # One more than MAX_ID_RANGE_SIZE
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=r"is too large.*Maximum allowed is 10000"):
             _ = params.id_list  # Access the property to trigger parsing
-        assert "is too large" in str(exc_info.value)
-        assert "Maximum allowed is 10000" in str(exc_info.value)
 
     def test_valid_large_range(self):
         """Test that ranges within limit are allowed."""
@@ -259,15 +227,11 @@ class TestPerformanceParams:
         assert params.fast is False
         assert params.include_inactive is False
 
-    def test_fast_mode(self):
-        """Test fast mode."""
-        params = BaseQueryParams(fast=True)
-        assert params.fast is True
-
-    def test_include_inactive(self):
-        """Test include inactive flag."""
-        params = BaseQueryParams(include_inactive=True)
-        assert params.include_inactive is True
+    @pytest.mark.parametrize("flag", ["fast", "include_inactive"])
+    def test_flag_enabled(self, flag: str) -> None:
+        """Test each performance flag can be switched on."""
+        params = BaseQueryParams.model_validate({flag: True})
+        assert getattr(params, flag) is True
 
 
 class TestSortingParams:
@@ -310,7 +274,7 @@ class TestBaseQueryParamsCombined:
             page_size=50,
             ids="1-10",
             fields="id,name",
-            created_since=datetime(2024, 1, 1, tzinfo=UTC),
+            created_since=_JAN1,
             sort_by="name",
             order=SortOrder.DESC,
             search="test",
@@ -320,7 +284,7 @@ class TestBaseQueryParamsCombined:
         assert params.page_size == 50
         assert params.id_list == list(range(1, 11))
         assert params.field_list == ["id", "name"]
-        assert params.created_since == datetime(2024, 1, 1, tzinfo=UTC)
+        assert params.created_since == _JAN1
         assert params.sort_by == "name"
         assert params.order == SortOrder.DESC
         assert params.search == "test"
@@ -344,17 +308,19 @@ class TestBaseQueryParamsCombined:
 
         ns_params = params.to_netsuite_params()
 
-        assert ns_params["page"] == "2"
-        assert ns_params["pageSize"] == "50"
-        assert ns_params["searchId"] == "ABC123"
-        assert ns_params["createdSince"] == "2024-01-01T12:00:00+00:00"
-        assert ns_params["fields"] == "id,name"
-        assert ns_params["ids"] == "1,2,3"
-        assert ns_params["fast"] == "true"
-        assert ns_params["sortBy"] == "name"
-        assert ns_params["order"] == "desc"
-        assert ns_params["search"] == "test"
-        assert ns_params["subsidiaryId"] == "123"
+        assert ns_params == {
+            "page": "2",
+            "pageSize": "50",
+            "searchId": "ABC123",
+            "createdSince": "2024-01-01T12:00:00+00:00",
+            "fields": "id,name",
+            "ids": "1,2,3",
+            "fast": "true",
+            "sortBy": "name",
+            "order": "desc",
+            "search": "test",
+            "subsidiaryId": "123",
+        }
 
 
 class TestCustomerQueryParams:
@@ -383,9 +349,8 @@ class TestCustomerQueryParams:
         assert params.status == "inactive"
 
         # Invalid status
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Status must be 'active' or 'inactive'"):
             CustomerQueryParams(status="pending")
-        assert "Status must be 'active' or 'inactive'" in str(exc_info.value)
 
     def test_customer_to_netsuite_params(self):
         """Test customer params conversion to NetSuite."""
@@ -399,11 +364,14 @@ class TestCustomerQueryParams:
 
         ns_params = params.to_netsuite_params()
 
-        assert ns_params["page"] == "1"
-        assert ns_params["status"] == "active"
-        assert ns_params["customerType"] == "Company"
-        assert ns_params["balanceMin"] == "100.0"
-        assert ns_params["balanceMax"] == "1000.0"
+        assert ns_params == {
+            "page": "1",
+            "pageSize": "20",
+            "status": "active",
+            "customerType": "Company",
+            "balanceMin": "100.0",
+            "balanceMax": "1000.0",
+        }
 
 
 class TestInvoiceQueryParams:
@@ -411,23 +379,20 @@ class TestInvoiceQueryParams:
 
     def test_invoice_specific_params(self):
         """Test invoice-specific parameters."""
-        due_since = datetime(2024, 1, 1, tzinfo=UTC)
-        due_before = datetime(2024, 12, 31, tzinfo=UTC)
-
         params = InvoiceQueryParams(
             status="open",
             customer_id=123,
             amount_min=100.0,
             amount_max=1000.0,
-            due_date_since=due_since,
-            due_date_before=due_before,
+            due_date_since=_JAN1,
+            due_date_before=_DEC31,
         )
         assert params.status == "open"
         assert params.customer_id == 123
         assert params.amount_min == 100.0
         assert params.amount_max == 1000.0
-        assert params.due_date_since == due_since
-        assert params.due_date_before == due_before
+        assert params.due_date_since == _JAN1
+        assert params.due_date_before == _DEC31
 
     def test_invoice_to_netsuite_params(self):
         """Test invoice params conversion to NetSuite."""
@@ -436,16 +401,19 @@ class TestInvoiceQueryParams:
             status="paid",
             customer_id=456,
             amount_min=50.0,
-            due_date_since=datetime(2024, 1, 1, 0, 0, 0, tzinfo=UTC),
+            due_date_since=_JAN1,
         )
 
         ns_params = params.to_netsuite_params()
 
-        assert ns_params["page"] == "1"
-        assert ns_params["status"] == "paid"
-        assert ns_params["customerId"] == "456"
-        assert ns_params["amountMin"] == "50.0"
-        assert ns_params["dueDateSince"] == "2024-01-01T00:00:00+00:00"
+        assert ns_params == {
+            "page": "1",
+            "pageSize": "20",
+            "status": "paid",
+            "customerId": "456",
+            "amountMin": "50.0",
+            "dueDateSince": "2024-01-01T00:00:00+00:00",
+        }
 
 
 class TestTransactionQueryParams:
@@ -473,7 +441,10 @@ class TestTransactionQueryParams:
 
         ns_params = params.to_netsuite_params()
 
-        assert ns_params["page"] == "3"
-        assert ns_params["transactionType"] == "Payment"
-        assert ns_params["accountId"] == "100"
-        assert ns_params["postingPeriodId"] == "6"
+        assert ns_params == {
+            "page": "3",
+            "pageSize": "20",
+            "transactionType": "Payment",
+            "accountId": "100",
+            "postingPeriodId": "6",
+        }
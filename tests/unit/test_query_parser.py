@@ -1,6 +1,8 @@
 """Unit tests for query parser utilities."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, timezone
+
+import httpx
 
 from app.utils.query_parser import (
     build_netsuite_filter,
@@ -35,11 +37,14 @@ class TestParseIdParameter:
         """Test comma-separated IDs."""
         assert parse_id_parameter("1,2,3") == [1, 2, 3]
         assert parse_id_parameter("1, 2, 3") == [1, 2, 3]  # With spaces
+        assert parse_id_parameter("1,-2,3") == [1, -2, 3]
+        assert parse_id_parameter("1,,3") == [1, 3]  # Empty parts are skipped
 
     def test_range(self):
         """Test ID range."""
         assert parse_id_parameter("1-5") == [1, 2, 3, 4, 5]
         assert parse_id_parameter("10-15") == [10, 11, 12, 13, 14, 15]
+        assert parse_id_parameter("1 - 3") == [1, 2, 3]  # Spaces around the separator
 
     def test_reverse_range(self):
         """Test reverse range (should be skipped)."""
@@ -68,11 +73,28 @@ class TestParseIdParameter:
         """Test invalid IDs."""
         assert parse_id_parameter("abc") is None
         assert parse_id_parameter("1,abc,3") == [1, 3]  # Partial valid
+        assert parse_id_parameter("-,+,1.5,²") is None
+
+    def test_oversized_id_skipped(self):
+        """Test an ID past the interpreter's int digit limit is skipped, not raised."""
+        assert parse_id_parameter("x,2," + "1" * 5000) == [2]
+        assert parse_id_parameter("1" * 5000) is None
+        assert parse_id_parameter("1," + "1" * 5000) == [1]
 
     def test_negative_ids(self):
         """Test negative IDs."""
         assert parse_id_parameter("-1") == [-1]
         assert parse_id_parameter("-5--1") == [-5, -4, -3, -2, -1]
+        assert parse_id_parameter("-2-1") == [-2, -1, 0, 1]
+
+    def test_malformed_ranges(self):
+        """Test strings that only look like ranges are rejected."""
+        assert parse_id_parameter("1-2-3") is None
+        assert parse_id_parameter("1-") is None
+        assert parse_id_parameter("a-5") is None
+        assert parse_id_parameter("- 5-1") is None
+        assert parse_id_parameter("1-" + "1" * 5000) is None
+        assert parse_id_parameter("x," + "1" * 5000 + "-" + "1" * 5000) is None
 
 
 class TestParseFieldList:
@@ -158,6 +180,11 @@ class TestParseDateParam:
         assert result.month == 1
         assert result.day == 1
 
+    def test_iso_uses_stdlib_datetime(self):
+        """Test ISO dates are parsed without going through pendulum."""
+        result = parse_date_param("2024-01-01T12:30:00")
+        assert type(result) is datetime
+
     def test_invalid_date(self):
         """Test invalid date format."""
         assert parse_date_param("not-a-date") is None
@@ -239,6 +266,14 @@ class TestParseFloatParam:
         """Test invalid float."""
         assert parse_float_param("not-a-number") is None
         assert parse_float_param("12.34.56") is None
+        assert parse_float_param("1e") is None
+
+    def test_non_finite_rejected(self):
+        """Test nan, inf and overflowing values are not accepted as query values."""
+        assert parse_float_param("nan") is None
+        assert parse_float_param("inf") is None
+        assert parse_float_param("1e400") is None
+        assert parse_float_param("-1e999") is None
 
 
 class TestBuildNetsuiteFilter:
@@ -298,6 +333,26 @@ class TestBuildNetsuiteFilter:
         assert filters["subsidiary"]["operator"] == "anyOf"
         assert filters["subsidiary"]["searchValue"] == [{"internalId": "123"}]
 
+    def test_filter_key_order(self):
+        """Test filters are emitted in a stable order regardless of parameter order."""
+        params = {
+            "subsidiary_id": 1,
+            "search": "acme",
+            "status": "active",
+            "ids": "123",
+            "updated_since": "2024-01-01",
+            "created_since": "2024-01-01",
+        }
+        filters = build_netsuite_filter(params)
+        assert list(filters) == [
+            "dateCreated",
+            "lastModifiedDate",
+            "internalId",
+            "isInactive",
+            "_text",
+            "subsidiary",
+        ]
+
 
 class TestExtractPaginationInfo:
     """Tests for extract_pagination_info function."""
@@ -335,6 +390,26 @@ class TestExtractPaginationInfo:
         assert info["total_pages"] == 0
         assert info["page_size"] == 20
 
+    def test_response_headers_mapping(self):
+        """Test case-insensitive response header mappings are accepted."""
+        headers = httpx.Headers({"netsuite-total-pages": "3", "netsuite-search-id": "XYZ"})
+        info = extract_pagination_info(headers)
+        assert info["search_id"] == "XYZ"
+        assert info["total_pages"] == 3
+        assert info["total_records"] == 0
+
+    def test_malformed_counts_use_defaults(self):
+        """Test non-numeric count headers fall back to their defaults."""
+        headers = {
+            "NETSUITE-TOTAL-RECORDS": "many",
+            "NETSUITE-TOTAL-PAGES": "",
+            "NETSUITE-PAGE-SIZE": " 50 ",
+        }
+        info = extract_pagination_info(headers)
+        assert info["total_records"] == 0
+        assert info["total_pages"] == 0
+        assert info["page_size"] == 50
+
 
 class TestFormatNetsuiteTimestamp:
     """Tests for format_netsuite_timestamp function."""
@@ -351,6 +426,12 @@ class TestFormatNetsuiteTimestamp:
         result = format_netsuite_timestamp(dt)
         assert result == "2024-01-01T00:00:00"
 
+    def test_drops_microseconds_and_offset(self):
+        """Test fractional seconds and UTC offsets are not emitted."""
+        dt = datetime(2024, 1, 15, 14, 30, 45, 123456, tzinfo=timezone(timedelta(hours=-8)))
+        result = format_netsuite_timestamp(dt)
+        assert result == "2024-01-15T14:30:45"
+
 
 class TestParseNetsuiteTimestamp:
     """Tests for parse_netsuite_timestamp function."""
@@ -384,6 +465,11 @@ class TestParseNetsuiteTimestamp:
         assert result is not None
         assert result.year == 2024
 
+    def test_timestamp_with_nonstandard_timezone(self):
+        """Test a timezone suffix fromisoformat rejects is stripped."""
+        result = parse_netsuite_timestamp("2024-01-15T14:30:45.000-8:00")
+        assert result == datetime(2024, 1, 15, 14, 30, 45, tzinfo=UTC)
+
     def test_invalid_timestamp(self):
         """Test invalid timestamp."""
         assert parse_netsuite_timestamp("not-a-timestamp") is None